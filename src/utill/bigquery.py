@@ -1,26 +1,53 @@
 from __future__ import annotations
 
 import datetime
-import math
+import decimal
+import hashlib
+import json
+import logging
+import multiprocessing
 import os
+import queue
+import re
 import shutil
+import tempfile
 import textwrap
 import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from contextlib import contextmanager
+from contextlib import nullcontext
+from dataclasses import asdict
+from dataclasses import dataclass
 from enum import Enum
 from enum import StrEnum
 from enum import auto
 from functools import lru_cache
+from threading import Event
 from threading import Lock
 from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
 from typing import cast
 
 from ._lazy_import import import_attr_cached
 from ._lazy_import import import_module_cached
 from ._lazy_logger import logger
+from .constants import ByteSize
 
 
 if TYPE_CHECKING:
+    import pyarrow as pyarrow_types
     from google.cloud import bigquery as bigquery_types
+    from google.cloud import bigquery_storage as bigquery_storage_types
+
+    from . import cloudstorage as cloudstorage_types
+    from .cache import ResultCache
+    from .dttm import Level
 
 
 @lru_cache(maxsize=1)
@@ -33,10 +60,25 @@ def _humanize_precisedelta():
     return import_attr_cached("humanize", "precisedelta")
 
 
+def _convert_csv_to_xlsx(src_filepath: str, dst_filepath: str, threads: int) -> float:
+    """Converter of BQ.download_xlsx, also a process pool worker, returns the conversion time in seconds"""
+
+    from . import xlsx
+
+    t = time.time()
+    xlsx.csv_to_xlsx(src_filepath, dst_filepath, threads=threads)
+    os.remove(src_filepath)
+    return time.time() - t
+
+
 PY_DATA_TYPE__BQ_DATA_TYPE = {
     int: "INTEGER",
     str: "STRING",
-    float: "STRING",
+    float: "FLOAT64",
+    bool: "BOOL",
+    datetime.date: "DATE",
+    datetime.datetime: "DATETIME",  # TIMESTAMP if timezone aware
+    decimal.Decimal: "NUMERIC",
 }
 
 
@@ -56,6 +98,12 @@ class DataFileCompression(StrEnum):
 class LoadStrategy(Enum):
     OVERWRITE = auto()
     APPEND = auto()
+    MERGE = auto()  # Upsert on merge keys through a staging temp table
+
+
+class DownloadMethod(Enum):
+    EXPORT = auto()  # EXPORT DATA into GCS, then download the shards
+    STORAGE_READ = auto()  # Read the result table through the Storage Read API
 
 
 class Dtype:
@@ -86,8 +134,390 @@ class Dtype:
     ARRAY_BOOL = "ARRAY<BOOL>"
 
 
+def _to_pyarrow_type(data_type: str) -> pyarrow_types.DataType:
+    """Map a BigQuery data type (see `Dtype`) into the pyarrow type used to write it as Parquet"""
+
+    pyarrow = import_module_cached("pyarrow")
+
+    data_type = data_type.strip().upper()
+    if data_type.startswith("ARRAY<") and data_type.endswith(">"):
+        return pyarrow.list_(_to_pyarrow_type(data_type[6:-1]))
+
+    if data_type in (Dtype.INT64, Dtype.INTEGER):
+        return pyarrow.int64()
+    elif data_type in (Dtype.FLOAT64, "FLOAT"):
+        return pyarrow.float64()
+    elif data_type in (Dtype.DECIMAL, "NUMERIC"):
+        return pyarrow.decimal128(38, 9)
+    elif data_type in (Dtype.STRING, Dtype.JSON):
+        return pyarrow.string()
+    elif data_type == Dtype.DATE:
+        return pyarrow.date32()
+    elif data_type == Dtype.TIME:
+        return pyarrow.time64("us")
+    elif data_type == Dtype.DATETIME:
+        return pyarrow.timestamp("us")
+    elif data_type == Dtype.TIMESTAMP:
+        return pyarrow.timestamp("us", tz="UTC")
+    elif data_type in (Dtype.BOOL, "BOOLEAN"):
+        return pyarrow.bool_()
+    raise ValueError(f"Unsupported data type: {data_type}")
+
+
+@dataclass
+class JobMetrics:
+    job_id: str | None
+    parent_job_id: str | None
+    statement_type: str | None
+    query: str | None
+    total_bytes_processed: int
+    total_bytes_billed: int | None  # None if not reported
+    slot_millis: int
+    cache_hit: bool | None  # None if not reported
+    num_dml_affected_rows: int
+    created: str | None
+    queue_ms: float | None
+    elapsed_ms: float | None
+    served_by: str = (
+        "job"  # "job", or "stateless" if the query ran without creating a job
+    )
+
+    @classmethod
+    def from_job(
+        cls, job: bigquery_types.QueryJob, parent_job_id: str | None = None
+    ) -> JobMetrics:
+        def _millis(start: datetime.datetime | None, end: datetime.datetime | None):
+            return (end - start).total_seconds() * 1000 if start and end else None
+
+        return cls(
+            job_id=job.job_id,
+            parent_job_id=parent_job_id,
+            statement_type=job.statement_type,
+            query=job.query,
+            total_bytes_processed=job.total_bytes_processed or 0,
+            total_bytes_billed=job.total_bytes_billed or 0,
+            slot_millis=job.slot_millis or 0,
+            cache_hit=bool(job.cache_hit),
+            num_dml_affected_rows=job.num_dml_affected_rows or 0,
+            created=job.created.isoformat() if job.created else None,
+            queue_ms=_millis(job.created, job.started),
+            elapsed_ms=_millis(job.started, job.ended),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: bigquery_types.table.RowIterator) -> JobMetrics:
+        """Build from the result of `query_and_wait`, which may have run without a job"""
+
+        def _millis(start: datetime.datetime | None, end: datetime.datetime | None):
+            return (end - start).total_seconds() * 1000 if start and end else None
+
+        return cls(
+            job_id=rows.job_id,
+            parent_job_id=None,
+            statement_type="SELECT",
+            query=rows.query,
+            total_bytes_processed=rows.total_bytes_processed or 0,
+            total_bytes_billed=None,  # Neither is part of the query_and_wait response
+            slot_millis=rows.slot_millis or 0,
+            cache_hit=None,
+            num_dml_affected_rows=0,
+            created=rows.created.isoformat() if rows.created else None,
+            queue_ms=_millis(rows.created, rows.started),
+            elapsed_ms=_millis(rows.started, rows.ended),
+            served_by="stateless" if rows.job_id is None else "job",
+        )
+
+
+class JobMetricsCollector:
+    """Job callback collecting every JobMetrics record, e.g. per pipeline run
+
+    Usage: `bq = BQ(job_callbacks=[collector])`, then `collector.dump_json(path)`.
+    """
+
+    def __init__(self):
+        self.records: list[JobMetrics] = []
+        self._lock = Lock()
+
+    def __call__(self, record: JobMetrics):
+        with self._lock:
+            self.records.append(record)
+
+    def top(self, n: int = 10, key: str = "total_bytes_billed") -> list[JobMetrics]:
+        """Most expensive statements by the given JobMetrics field"""
+
+        with self._lock:
+            return sorted(
+                self._get_leaves(), key=lambda r: getattr(r, key) or 0, reverse=True
+            )[:n]
+
+    def summary(self) -> dict:
+        with self._lock:
+            leaves = self._get_leaves()
+            return {
+                "jobs": len(leaves),
+                "total_bytes_processed": sum(r.total_bytes_processed for r in leaves),
+                "total_bytes_billed": sum(r.total_bytes_billed or 0 for r in leaves),
+                "slot_millis": sum(r.slot_millis for r in leaves),
+                "cache_hits": sum(bool(r.cache_hit) for r in leaves),
+            }
+
+    def to_dict(self) -> dict:
+        summary = self.summary()
+        with self._lock:
+            return {
+                "summary": summary,
+                "jobs": [asdict(r) for r in self.records],
+            }
+
+    def _get_leaves(self) -> list[JobMetrics]:
+        # Parent jobs of scripts carry the totals of their children, keep statements only
+        parent_job_ids = {r.parent_job_id for r in self.records} - {None}
+        return [r for r in self.records if r.job_id not in parent_job_ids]
+
+    def dump_json(self, filename: str):
+        with open(os.path.expanduser(filename), "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logger.info(f"Job metrics written: {filename}")
+
+
+class CostGuardAction(Enum):
+    RAISE = auto()
+    WARN = auto()
+
+
+class CostBudgetExceededError(Exception):
+    pass
+
+
+class CostGuard:
+    """Byte budget for the queries run by BQ, checked against a dry-run estimate before each job runs
+
+    Estimates are reserved from the session budget while their job runs, then settled against the bytes actually billed.
+    """
+
+    def __init__(
+        self,
+        max_bytes_per_query: int | None = None,
+        max_bytes_per_session: int | None = None,
+        action: CostGuardAction = CostGuardAction.RAISE,
+        max_cached_estimates: int = 1024,
+    ):
+        """
+        Args:
+            max_bytes_per_query (int | None, optional): Budget of a single job, also set as `maximum_bytes_billed` in RAISE mode. Defaults to None.
+            max_bytes_per_session (int | None, optional): Cumulative budget of every job run through this guard. Defaults to None.
+            action (CostGuardAction, optional): Raise CostBudgetExceededError or only log a warning when a budget would be exceeded. Defaults to CostGuardAction.RAISE.
+            max_cached_estimates (int, optional): Number of dry-run estimates kept, keyed on the project, location, normalized query and parameters. Defaults to 1024.
+        """
+
+        self.max_bytes_per_query = max_bytes_per_query
+        self.max_bytes_per_session = max_bytes_per_session
+        self.action = action
+        self.max_cached_estimates = max_cached_estimates
+        self.bytes_billed = 0  # Cumulative bytes billed by the guarded jobs
+        self.bytes_reserved = 0  # Estimates of the guarded jobs still running
+        self._estimates: OrderedDict[str, int] = OrderedDict()
+        self._lock = Lock()
+
+    def get_estimate(self, key: str) -> int | None:
+        with self._lock:
+            if key in self._estimates:
+                self._estimates.move_to_end(key)
+            return self._estimates.get(key)
+
+    def set_estimate(self, key: str, estimate: int):
+        with self._lock:
+            self._estimates[key] = estimate
+            self._estimates.move_to_end(key)
+            while len(self._estimates) > self.max_cached_estimates:
+                self._estimates.popitem(last=False)
+
+    def get_maximum_bytes_billed(self, reserved: int = 0) -> int | None:
+        """Hard limit to put on the job holding `reserved` bytes of the session budget, None if there is no limit"""
+
+        if self.action != CostGuardAction.RAISE:
+            return None
+        limits = []
+        if self.max_bytes_per_query is not None:
+            limits.append(self.max_bytes_per_query)
+        if self.max_bytes_per_session is not None:
+            with self._lock:
+                # Everything already billed or held by the other running jobs
+                committed = self.bytes_billed + self.bytes_reserved - reserved
+            limits.append(max(self.max_bytes_per_session - committed, 0))
+        return min(limits) if limits else None
+
+    def check(self, estimate: int) -> int:
+        """Check the estimate against the budgets and reserve it from the session budget, so concurrent jobs cannot all spend the same remainder
+
+        Returns:
+            int: Bytes reserved, to pass to `settle` once the job is done
+        """
+
+        naturalsize = _humanize_naturalsize()
+        with self._lock:
+            committed = self.bytes_billed + self.bytes_reserved
+            if (
+                self.max_bytes_per_query is not None
+                and estimate > self.max_bytes_per_query
+            ):
+                message = f"Query estimate {naturalsize(estimate)} exceeds the per-query budget of {naturalsize(self.max_bytes_per_query)}"
+            elif (
+                self.max_bytes_per_session is not None
+                and committed + estimate > self.max_bytes_per_session
+            ):
+                message = f"Query estimate {naturalsize(estimate)} would exceed the session budget of {naturalsize(self.max_bytes_per_session)}, {naturalsize(committed)} already billed or reserved"
+            else:
+                message = None
+
+            if message is None or self.action != CostGuardAction.RAISE:
+                self.bytes_reserved += estimate
+
+        if message is None:
+            return estimate
+        if self.action == CostGuardAction.RAISE:
+            raise CostBudgetExceededError(message)
+        logger.warning(message)
+        return estimate
+
+    def settle(self, reserved: int, bytes_billed: int):
+        """Release a reservation made by `check` and count what the job actually billed"""
+
+        with self._lock:
+            self.bytes_reserved -= reserved
+            self.bytes_billed += bytes_billed
+
+    def add_billed(self, bytes_billed: int):
+        with self._lock:
+            self.bytes_billed += bytes_billed
+
+
+class TableMetadataCache:
+    """Dataset-level table metadata, loaded in bulk and invalidated by TTL"""
+
+    STALE = {}  # Placeholder for a table known to exist but whose metadata changed
+
+    def __init__(self, ttl_seconds: float = 300):
+        self.ttl_seconds = ttl_seconds
+        self._datasets: dict[str, tuple[float, dict[str, dict]]] = {}
+        self._lock = Lock()
+
+    def get(self, table_fqn: str) -> tuple[bool, dict | None]:
+        """Returns (hit, metadata), metadata is None if the table does not exist"""
+
+        dataset_fqn, table_id = table_fqn.rsplit(".", 1)
+        with self._lock:
+            dataset = self._datasets.get(dataset_fqn)
+            if dataset is None or dataset[0] + self.ttl_seconds < time.time():
+                return False, None
+            return True, dataset[1].get(table_id)
+
+    def load(self, dataset_fqn: str, tables: dict[str, dict]):
+        with self._lock:
+            self._datasets[dataset_fqn] = (time.time(), dict(tables))
+
+    def mark_exists(self, table_fqn: str):
+        dataset_fqn, table_id = table_fqn.rsplit(".", 1)
+        with self._lock:
+            if dataset_fqn in self._datasets:
+                self._datasets[dataset_fqn][1][table_id] = self.STALE
+
+    def mark_dropped(self, table_fqn: str):
+        dataset_fqn, table_id = table_fqn.rsplit(".", 1)
+        with self._lock:
+            if dataset_fqn in self._datasets:
+                self._datasets[dataset_fqn][1].pop(table_id, None)
+
+    def invalidate(self, dataset_fqn: str | None = None):
+        with self._lock:
+            if dataset_fqn is None:
+                self._datasets.clear()
+            else:
+                self._datasets.pop(dataset_fqn, None)
+
+
+class ScratchSpace:
+    """Intermediate tables in a scratch dataset, every table expires on its own so nothing leaks if the process dies
+
+    Create through `BQ.scratch()`.
+    """
+
+    def __init__(self, bq: BQ, dataset_fqn: str, expiration: datetime.timedelta):
+        self.bq = bq
+        self.dataset_fqn = dataset_fqn
+        self.expiration = expiration
+        self.table_fqns: list[str] = []
+
+    def get_table_fqn(self, prefix: str = "tmp") -> str:
+        """Reserve a unique table name in the scratch dataset"""
+
+        from .dttm import get_current_datetime_str
+        from .string import generate_random_string
+
+        table_fqn = f"{self.dataset_fqn}.{prefix}_{get_current_datetime_str()}_{generate_random_string(8, alphanum=True).lower()}"
+        self.table_fqns.append(table_fqn)
+        return table_fqn
+
+    def create_table(
+        self,
+        query: str,
+        query_parameters: dict = {},
+        *,
+        prefix: str = "tmp",
+        partition_by: str | None = None,
+        clustering_fields: list[str] | None = None,
+    ) -> str:
+        """Materialize a query into a new expiring scratch table
+
+        Returns:
+            str: The scratch table FQN
+        """
+
+        table_fqn = self.get_table_fqn(prefix)
+        self.bq.create_table(
+            table_fqn,
+            query,
+            query_parameters,
+            partition_by=partition_by,
+            clustering_fields=clustering_fields,
+            expiration_timestamp_utc=datetime.datetime.now(datetime.timezone.utc)
+            + self.expiration,
+        )
+        return table_fqn
+
+    def drop_all(self):
+        for table_fqn in self.table_fqns:
+            self.bq.drop_table(table_fqn)
+        self.table_fqns = []
+
+
 class BQ:
-    def __init__(self, location: str | None = None, project_id: str = None):
+    def __init__(
+        self,
+        location: str | None = None,
+        project_id: str = None,
+        *,
+        emulator_endpoint: str | None = None,
+        emulator_grpc_endpoint: str | None = None,
+        result_cache: ResultCache | None = None,
+        job_callbacks: list[Callable[[JobMetrics], None]] | None = None,
+        cost_guard: CostGuard | None = None,
+        metadata_cache_ttl: float = 300,
+        http_pool_maxsize: int | None = None,
+    ):
+        """
+        Args:
+            location (str | None, optional): Job location. Defaults to GCP_REGION env.
+            project_id (str, optional): Billing project. Defaults to GCP_PROJECT_ID env.
+            emulator_endpoint (str | None, optional): REST endpoint of a local BigQuery emulator, e.g. `http://localhost:9050`. Uses anonymous credentials.
+            emulator_grpc_endpoint (str | None, optional): gRPC endpoint of the emulator's Storage Read API, e.g. `localhost:9060`.
+            result_cache (ResultCache | None, optional): Cache used by `fetch_rows`. Defaults to None (no caching).
+            job_callbacks (list[Callable[[JobMetrics], None]] | None, optional): Called with a JobMetrics record for each finished job and child job, e.g. a JobMetricsCollector. Defaults to None.
+            cost_guard (CostGuard | None, optional): Dry-run every query first and enforce its byte budgets. Defaults to None.
+            metadata_cache_ttl (float, optional): Lifetime in seconds of the dataset-level table metadata cache. Defaults to 300.
+            http_pool_maxsize (int | None, optional): HTTP connection pool size, raise it for highly concurrent workloads. Defaults to None (library default of 10).
+        """
+
         bigquery = import_module_cached("google.cloud.bigquery")
 
         from .settings import envs
@@ -98,10 +528,37 @@ class BQ:
         # if location is None and my_env.envs.GCP_REGION is None:
         #     raise ValueError('GCP region must be set in environment variables.')
 
+        client_kwargs = {}
+        if emulator_endpoint:
+            client_kwargs["client_options"] = {"api_endpoint": emulator_endpoint}
+            client_kwargs["credentials"] = import_attr_cached(
+                "google.auth.credentials", "AnonymousCredentials"
+            )()
+        if http_pool_maxsize is not None:
+            from . import clients
+
+            if "credentials" not in client_kwargs:
+                client_kwargs["credentials"] = clients.get_default_credentials(
+                    bigquery.Client.SCOPE
+                )
+            client_kwargs["_http"] = clients.build_http_session(
+                client_kwargs["credentials"], http_pool_maxsize
+            )
+
         self.client = bigquery.Client(
             project=project_id or envs.GCP_PROJECT_ID,
             location=location or envs.GCP_REGION,
+            **client_kwargs,
         )
+        self.client.default_job_creation_mode = "JOB_CREATION_OPTIONAL"  # Lets short queries in fetch_rows skip job creation
+        self.emulator_grpc_endpoint = emulator_grpc_endpoint
+        self.result_cache = result_cache
+        self.job_callbacks = list(job_callbacks or [])
+        self.cost_guard = cost_guard
+        self.table_metadata_cache = TableMetadataCache(ttl_seconds=metadata_cache_ttl)
+        self._read_client: bigquery_storage_types.BigQueryReadClient | None = None
+        self._read_client_lock = Lock()
+        self._scratch_dataset_fqns: set[str] = set()
         logger.debug(f"BQ client open, project: {self.client.project}")
 
     # MARK: Query execution
@@ -115,43 +572,9 @@ class BQ:
     ) -> bigquery_types.QueryJob:
         bigquery = import_module_cached("google.cloud.bigquery")
 
-        # Reconstruct query, handle multiple queries in a single job
         is_multi = isinstance(query, list)
-        queries = query if is_multi else [query]
-        queries = [textwrap.dedent(q).strip() for q in queries]
-        queries = [
-            q if q.endswith(";") else q + ";" for q in queries
-        ]  # Append ';' character for each query
-        query = "\n".join(queries)
-
-        # Evaluate parameter
-        query_parameters = []
-        for parameter, value in parameters.items():
-            is_array = isinstance(value, list)
-            value_type_py = type(value[0]) if is_array else type(value)
-            if value_type_py not in PY_DATA_TYPE__BQ_DATA_TYPE:
-                raise ValueError(
-                    f"Unsupported type for parameter {parameter}: {value_type_py}. Supported types are: {list(PY_DATA_TYPE__BQ_DATA_TYPE.keys())}"
-                )
-
-            value_type_bq = PY_DATA_TYPE__BQ_DATA_TYPE[value_type_py]
-
-            # Handle data type conversions
-            if value_type_py == datetime.date:
-                value = (
-                    [v.strftime("%Y-%m-%d") for v in value]
-                    if is_array
-                    else value.strftime("%Y-%m-%d")
-                )
-
-            if is_array:
-                query_parameters.append(
-                    bigquery.ArrayQueryParameter(parameter, value_type_bq, value)
-                )
-            else:
-                query_parameters.append(
-                    bigquery.ScalarQueryParameter(parameter, value_type_bq, value)
-                )
+        query = self._normalize_query(query)
+        query_parameters = self._build_query_parameters(parameters)
 
         logger.debug(f"🔎 Query:\n{query}")
         query_job_config = bigquery.QueryJobConfig(
@@ -159,17 +582,30 @@ class BQ:
         )
         if temporary_table:
             query_job_config.destination = None
+        reserved = None
+        if self.cost_guard is not None and not dry_run:
+            reserved = self._apply_cost_guard(query, parameters, query_job_config)
         t = time.time()
-        query_job = self.client.query(query, job_config=query_job_config)
-        (
-            logger.info(
-                f"Job tracking: https://console.cloud.google.com/bigquery?project={self.client.project}&j=bq:{self.client.location}:{query_job.job_id}&page=queryresults"
+        query_job = None
+        try:
+            query_job = self.client.query(query, job_config=query_job_config)
+            (
+                logger.info(
+                    f"Job tracking: https://console.cloud.google.com/bigquery?project={self.client.project}&j=bq:{self.client.location}:{query_job.job_id}&page=queryresults"
+                )
+                if not dry_run
+                else None
             )
-            if not dry_run
-            else None
-        )
-        query_job.result()  # Wait for the job to complete
+            query_job.result()  # Wait for the job to complete
+        finally:
+            # A failed job may still have billed something
+            if reserved is not None:
+                self.cost_guard.settle(
+                    reserved,
+                    (query_job.total_bytes_billed or 0) if query_job is not None else 0,
+                )
         elapsed = _humanize_precisedelta()(datetime.timedelta(seconds=time.time() - t))
+        child_jobs: list[bigquery_types.QueryJob] = []
 
         if not is_multi:
             naturalsize = _humanize_naturalsize()
@@ -179,19 +615,177 @@ class BQ:
         else:
             logger.info(f"[Job ID] {query_job.job_id} [Elapsed] {elapsed}")
 
-            jobs: list[bigquery_types.QueryJob] = list(
-                self.client.list_jobs(parent_job=query_job.job_id)
-            )
-            naturalsize = _humanize_naturalsize()
-            [
-                logger.info(
-                    f"[Script ID] {job.job_id}, [Processed] {naturalsize(job.total_bytes_processed)}, [Billed] {naturalsize(job.total_bytes_billed)}, [Affected] {job.num_dml_affected_rows or 0} row(s)",
+            # Child jobs need an extra API call, only fetch them if someone consumes them
+            if logger.isEnabledFor(logging.INFO) or self.job_callbacks:
+                jobs: list[bigquery_types.QueryJob] = list(
+                    self.client.list_jobs(parent_job=query_job.job_id)
                 )
-                for job in jobs
-            ]
+                naturalsize = _humanize_naturalsize()
+                [
+                    logger.info(
+                        f"[Script ID] {job.job_id}, [Processed] {naturalsize(job.total_bytes_processed)}, [Billed] {naturalsize(job.total_bytes_billed)}, [Affected] {job.num_dml_affected_rows or 0} row(s)",
+                    )
+                    for job in jobs
+                ]
+                child_jobs = jobs
+
+        if not dry_run:
+            self._emit_job_metrics(query_job, child_jobs)
 
         return query_job
 
+    def submit_many(
+        self,
+        queries: list[str | list[str]],
+        parameters: list[dict] | None = None,
+        *,
+        max_concurrency: int = 10,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 10.0,
+    ) -> Iterator[tuple[int, bigquery_types.QueryJob]]:
+        """Submit independent queries as concurrent jobs, without waiting for each one before submitting the next
+
+        Jobs are polled with exponential backoff and go through the client's cost guard. If a job fails, the remaining queries are not submitted, the in-flight jobs are cancelled and the error is raised. Closing the iterator early cancels the in-flight jobs as well.
+
+        Args:
+            queries (list[str | list[str]]): The queries, each one runs as its own job
+            parameters (list[dict] | None, optional): Query parameters, one dict per query. Defaults to None.
+            max_concurrency (int, optional): Maximum number of jobs running at once. Defaults to 10.
+            poll_interval (float, optional): Initial polling interval in seconds. Defaults to 0.5.
+            max_poll_interval (float, optional): Maximum polling interval in seconds. Defaults to 10.0.
+
+        Yields:
+            tuple[int, QueryJob]: Index of the query in `queries` and its finished job, in completion order
+        """
+
+        bigquery = import_module_cached("google.cloud.bigquery")
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if parameters is not None and len(parameters) != len(queries):
+            raise ValueError("parameters must have one dict per query")
+
+        pending = list(enumerate(queries))[::-1]  # Pop from the end
+        in_flight: list[tuple[int, bigquery_types.QueryJob]] = []
+        reservations: dict[str, int] = {}  # Cost guard reservation by job ID
+        interval = poll_interval
+
+        def _settle(query_job: bigquery_types.QueryJob):
+            if query_job.job_id in reservations:
+                self.cost_guard.settle(
+                    reservations.pop(query_job.job_id),
+                    query_job.total_bytes_billed or 0,
+                )
+
+        try:
+            while pending or in_flight:
+                # Fill the free slots
+                while pending and len(in_flight) < max_concurrency:
+                    i, query = pending.pop()
+                    query = self._normalize_query(query)
+                    query_parameters = parameters[i] if parameters else {}
+                    job_config = bigquery.QueryJobConfig(
+                        query_parameters=self._build_query_parameters(query_parameters)
+                    )
+                    reserved = None
+                    if self.cost_guard is not None:
+                        reserved = self._apply_cost_guard(
+                            query, query_parameters, job_config
+                        )
+                    try:
+                        query_job = self.client.query(query, job_config=job_config)
+                    except BaseException:
+                        if reserved is not None:
+                            self.cost_guard.settle(reserved, 0)
+                        raise
+                    if reserved is not None:
+                        reservations[query_job.job_id] = reserved
+                    logger.debug(f"Job submitted: {query_job.job_id} (query #{i})")
+                    in_flight.append((i, query_job))
+
+                # Poll, done() reloads the job state
+                finished = [(i, job) for i, job in in_flight if job.done()]
+                for i, query_job in finished:
+                    in_flight.remove((i, query_job))
+                    _settle(query_job)
+                    query_job.result()  # Raise if the job failed
+                    logger.info(
+                        f"[Job ID] {query_job.job_id}, [Query] #{i}, [Processed] {_humanize_naturalsize()(query_job.total_bytes_processed or 0)}, [Elapsed] {_humanize_precisedelta()(query_job.ended - query_job.created)}"
+                    )
+                    self._emit_job_metrics(query_job)
+                    yield i, query_job
+
+                # Back off while nothing completes
+                if finished:
+                    interval = poll_interval
+                elif in_flight:
+                    time.sleep(interval)
+                    interval = min(interval * 2, max_poll_interval)
+        except BaseException:
+            for _, query_job in in_flight:
+                query_job.cancel()
+                _settle(query_job)
+                logger.warning(f"Job cancelled: {query_job.job_id}")
+            raise
+
+    def fetch_rows(
+        self,
+        query: str | list[str],
+        parameters: dict = {},
+        *,
+        use_cache: bool = True,
+        fast: bool = True,
+    ) -> list[bigquery_types.Row]:
+        """Run a query and return all its rows
+
+        If the client has a `result_cache`, results of SELECT statements are cached, keyed on the project, location, normalized query and parameters.
+        Read-only queries go through the low-latency `query_and_wait` API, which skips job creation when BigQuery allows it, and fall back to a regular job on server errors.
+
+        Args:
+            query (str | list[str]): The query
+            parameters (dict, optional): Query parameters. Defaults to {}.
+            use_cache (bool, optional): Look up and store the result in `result_cache`. Defaults to True.
+            fast (bool, optional): Use the short query path for SELECT / WITH statements. Defaults to True.
+
+        Returns:
+            list[Row]: The rows
+        """
+
+        row_cls = import_attr_cached("google.cloud.bigquery.table", "Row")
+
+        cache_key = None
+        if use_cache and self.result_cache is not None:
+            cache_key = self._build_cache_key(query, parameters)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Result cache hit: {cache_key}")
+                field_to_index, values = cached
+                return [row_cls(row_values, field_to_index) for row_values in values]
+
+        result = None
+        if fast and self._is_read_only_query(query):
+            result = self._query_and_wait(query, parameters)
+        if result is not None:
+            is_select = True
+            bytes_processed = result.total_bytes_processed or 0
+        else:
+            query_job = self.execute_query(query, parameters=parameters)
+            result = query_job.result()
+            is_select = query_job.statement_type == "SELECT"
+            bytes_processed = query_job.total_bytes_processed or 0
+        rows = list(result)
+
+        # Only cache reads, Row is not picklable so store its raw values
+        if cache_key is not None and is_select:
+            field_to_index = {field.name: i for i, field in enumerate(result.schema)}
+            self.result_cache.set(
+                cache_key,
+                (field_to_index, [row.values() for row in rows]),
+                bytes_saved_per_hit=bytes_processed,
+            )
+
+        return rows
+
     # MARK: Table operations
 
     def create_table(
@@ -207,9 +801,54 @@ class BQ:
         expiration_timestamp_utc: datetime.datetime | None = None,
         require_partition_filter: bool = False,
         replace: bool = False,
+        partitions: list | None = None,
+        partition_range: tuple[datetime.date | str, datetime.date | str] | None = None,
+        partition_level: Level | None = None,
     ):
+        """Create a table from a query, or insert into it if it exists
+
+        Passing `partitions` or `partition_range` rebuilds only those partitions of an existing table: rows whose `partition_by` value is in the list are deleted and re-inserted from the query in one transaction.
+        If the table does not exist yet, it is created from the query filtered to those partitions.
+
+        Args:
+            dst_table_fqn (str): Destination table
+            query (str): Source query
+            query_parameters (dict, optional): Query parameters. Defaults to {}.
+            description (str | None, optional): Table description. Defaults to None.
+            schema (list[dict] | None, optional): Table schema. Defaults to None.
+            partition_by (str | None, optional): Partition expression, e.g. `dt` or `DATE(created_at)`. Defaults to None.
+            clustering_fields (list[str] | None, optional): Clustering columns. Defaults to None.
+            expiration_timestamp_utc (datetime.datetime | None, optional): Table expiration. Defaults to None.
+            require_partition_filter (bool, optional): Require a partition filter on queries. Defaults to False.
+            replace (bool, optional): Replace the whole table if it exists. Defaults to False.
+            partitions (list | None, optional): Partition values to replace, compared against `partition_by`. Defaults to None.
+            partition_range (tuple[datetime.date | str, datetime.date | str] | None, optional): Inclusive date range to replace, expanded with `dttm.generate_dates`. Defaults to None.
+            partition_level (Level | None, optional): Granularity of `partition_range`, use `Level.MONTH` for a `DATE_TRUNC(..., MONTH)` partitioning. Defaults to Level.DAY.
+        """
+
+        from . import dttm
+
         self.raise_for_invalid_table_fqn(dst_table_fqn)
 
+        # Resolve the partitions to replace
+        if partitions is not None and partition_range is not None:
+            raise ValueError("Provide either partitions or partition_range, not both")
+        if partition_range is not None:
+            partitions = dttm.generate_dates(
+                *partition_range, partition_level or dttm.Level.DAY
+            )
+        if partitions is not None:
+            if not partition_by:
+                raise ValueError("partition_by must be provided to replace partitions")
+            if replace:
+                raise ValueError("replace cannot be used to replace partitions")
+            if not partitions:
+                raise ValueError("partitions cannot be empty")
+            if "_partitions" in query_parameters:
+                raise ValueError("_partitions is a reserved query parameter")
+            query = f"SELECT * FROM (\n{textwrap.dedent(query).strip()}\n)\nWHERE {partition_by} IN UNNEST(@_partitions)"
+            query_parameters = {**query_parameters, "_partitions": list(partitions)}
+
         # Construct table options
         logger.debug("Constructing table options ...")
         table_options = []
@@ -224,17 +863,27 @@ class BQ:
 
         # Check if table exists
         logger.debug("Checking if destination table exists ...")
-        dst_table_project_id, dst_table_dataset_id, dst_table_id = (
-            self.get_table_fqn_parts(dst_table_fqn)
-        )
-        table_exist = self.is_table_exists(
-            project_id=dst_table_project_id,
-            dataset_id=dst_table_dataset_id,
-            table_id=dst_table_id,
-        )
+        table_exist = self.is_table_exists(dst_table_fqn, use_cache=True)
 
         # Construct beautiful query string
-        if table_exist and not replace:
+        if table_exist and partitions is not None:
+            logger.debug(
+                f"Table exists, constructing DELETE + INSERT transaction for {len(partitions)} partition(s) ..."
+            )
+            columns_str = (
+                f" ({', '.join(column['name'] for column in schema)})" if schema else ""
+            )
+            query_parts = [
+                "BEGIN TRANSACTION;",
+                f"DELETE FROM `{dst_table_fqn}` WHERE {partition_by} IN UNNEST(@_partitions);",
+                f"INSERT INTO `{dst_table_fqn}`{columns_str}",
+                f"{query};",
+                "COMMIT TRANSACTION;",
+            ]
+            query = "\n".join(query_parts)
+            self.execute_query(query, parameters=query_parameters)
+            return
+        elif table_exist and not replace:
             logger.debug("Table exists, constructing INSERT query ...")
             query_parts = [f"INSERT INTO `{dst_table_fqn}`"]
             if schema:
@@ -270,11 +919,139 @@ class BQ:
         logger.debug("Executing query ...")
         query = "\n".join(query_parts)
         self.execute_query(query, parameters=query_parameters)
+        self.table_metadata_cache.mark_exists(dst_table_fqn)
 
     def drop_table(self, bq_table_fqn: str):
         logger.info(f"Dropping table: {bq_table_fqn} ...")
         self.raise_for_invalid_table_fqn(bq_table_fqn)
         self.client.delete_table(bq_table_fqn, not_found_ok=True)
+        self.table_metadata_cache.mark_dropped(bq_table_fqn)
+
+    def get_table_metadata(self, table_fqn: str) -> dict | None:
+        """Get table metadata from the dataset-level metadata cache, loading the whole dataset on a miss
+
+        Returns:
+            dict | None: `table_type`, `schema` (list of `name` / `data_type`), `partition_column`, `clustering_fields`, `row_count`, `size_bytes` and `last_modified_time`, or None if the table does not exist
+        """
+
+        self.raise_for_invalid_table_fqn(table_fqn)
+        hit, metadata = self.table_metadata_cache.get(table_fqn)
+        # A table missing from a loaded snapshot may have been created since, only the API can tell
+        if hit and metadata is None and self.is_table_exists(table_fqn):
+            hit = False
+        if not hit or metadata is TableMetadataCache.STALE:
+            self.load_dataset_metadata(table_fqn.rsplit(".", 1)[0])
+            _, metadata = self.table_metadata_cache.get(table_fqn)
+        return metadata
+
+    def load_dataset_metadata(self, dataset_fqn: str) -> dict[str, dict]:
+        """Load existence, schema, partitioning and row counts of every table in a dataset with a single query, and cache it
+
+        Args:
+            dataset_fqn (str): `<projectid>.<datasetid>`
+
+        Returns:
+            dict[str, dict]: Table ID to metadata, see `get_table_metadata`
+        """
+
+        not_found = import_attr_cached("google.cloud.exceptions", "NotFound")
+
+        if len(dataset_fqn.split(".")) != 2:
+            raise ValueError(f"{dataset_fqn} is not a valid dataset FQN")
+
+        query = f"""
+            WITH columns AS (
+              SELECT
+                table_name,
+                ARRAY_AGG(
+                  STRUCT(column_name AS name, data_type, is_partitioning_column = 'YES' AS is_partitioning_column, clustering_ordinal_position)
+                  ORDER BY ordinal_position
+                ) AS columns
+              FROM `{dataset_fqn}.INFORMATION_SCHEMA.COLUMNS`
+              GROUP BY table_name
+            )
+            SELECT t.table_name, t.table_type, c.columns, m.row_count, m.size_bytes, m.last_modified_time
+            FROM `{dataset_fqn}.INFORMATION_SCHEMA.TABLES` t
+            LEFT JOIN columns c USING (table_name)
+            LEFT JOIN `{dataset_fqn}.__TABLES__` m ON m.table_id = t.table_name
+        """
+        try:
+            rows = list(self.execute_query(query).result())
+        except not_found:
+            # Also raised for a dataset in another location than the client, only a missing dataset means no tables
+            try:
+                self.client.get_dataset(dataset_fqn)
+            except not_found:
+                rows = []
+            else:
+                raise
+
+        tables = {}
+        for row in rows:
+            columns = row["columns"] or []
+            tables[row["table_name"]] = {
+                "table_type": row["table_type"],
+                "schema": [
+                    {"name": column["name"], "data_type": column["data_type"]}
+                    for column in columns
+                ],
+                "partition_column": next(
+                    (c["name"] for c in columns if c["is_partitioning_column"]), None
+                ),
+                "clustering_fields": [
+                    c["name"]
+                    for c in sorted(
+                        columns, key=lambda c: c["clustering_ordinal_position"] or 0
+                    )
+                    if c["clustering_ordinal_position"]
+                ],
+                "row_count": row["row_count"],
+                "size_bytes": row["size_bytes"],
+                "last_modified_time": datetime.datetime.fromtimestamp(
+                    row["last_modified_time"] / 1000, tz=datetime.timezone.utc
+                )
+                if row["last_modified_time"] is not None
+                else None,
+            }
+        self.table_metadata_cache.load(dataset_fqn, tables)
+        logger.debug(f"Dataset metadata loaded: {dataset_fqn}, {len(tables)} table(s)")
+        return tables
+
+    @contextmanager
+    def scratch(
+        self,
+        dataset_fqn: str | None = None,
+        *,
+        expiration: datetime.timedelta = datetime.timedelta(hours=6),
+        drop_on_exit: bool = False,
+    ) -> Iterator[ScratchSpace]:
+        """Scratch space for intermediate tables, usage: `with bq.scratch() as scratch: table_fqn = scratch.create_table(query)`
+
+        The dataset is created on first use with a default table expiration, and every scratch table also gets its own expiration timestamp.
+        Cleanup is left to BigQuery, so there is nothing to pay on exit and nothing leaks on a crash.
+
+        Args:
+            dataset_fqn (str | None, optional): Scratch dataset. Defaults to `<project>.utill_scratch`.
+            expiration (datetime.timedelta, optional): Lifetime of each scratch table. Defaults to 6 hours.
+            drop_on_exit (bool, optional): Also drop the tables when leaving the context. Defaults to False.
+        """
+
+        bigquery = import_module_cached("google.cloud.bigquery")
+
+        dataset_fqn = dataset_fqn or f"{self.client.project}.utill_scratch"
+        if dataset_fqn not in self._scratch_dataset_fqns:
+            dataset = bigquery.Dataset(dataset_fqn)
+            dataset.location = self.client.location
+            dataset.default_table_expiration_ms = int(expiration.total_seconds() * 1000)
+            self.client.create_dataset(dataset, exists_ok=True)
+            self._scratch_dataset_fqns.add(dataset_fqn)
+
+        scratch = ScratchSpace(self, dataset_fqn, expiration)
+        try:
+            yield scratch
+        finally:
+            if drop_on_exit:
+                scratch.drop_all()
 
     # MARK: Table data
 
@@ -290,11 +1067,35 @@ class BQ:
         load_strategy: LoadStrategy = LoadStrategy.APPEND,
         format: DataFileFormat = DataFileFormat.CSV,
         compression=None,
+        merge_keys: list[str] | None = None,
+        merge_partition_column: str | None = None,
     ):
+        """Load files from GCS into a table with a LOAD DATA statement
+
+        With `LoadStrategy.MERGE` the files are loaded into a temp table, then merged into the destination on `merge_keys`: matched rows are updated, the rest inserted.
+        If `merge_partition_column` is set, the destination is only scanned between the minimum and maximum of that column in the staging data, so only the touched partitions are billed.
+        A missing destination table is simply loaded.
+
+        Args:
+            src_gcs_uri (str): Source URI, may contain a wildcard
+            dst_table_fqn (str): Destination table
+            schema (list[dict] | None, optional): Table schema, auto detected if not provided. Defaults to None.
+            partition_by (str | None, optional): Partition expression. Defaults to None.
+            clustering_fields (list[str] | None, optional): Clustering columns. Defaults to None.
+            field_delimiter (str, optional): CSV delimiter. Defaults to ",".
+            load_strategy (LoadStrategy, optional): Load strategy. Defaults to LoadStrategy.APPEND.
+            format (DataFileFormat, optional): File format. Defaults to DataFileFormat.CSV.
+            compression (DataFileCompression, optional): File compression. Defaults to None.
+            merge_keys (list[str] | None, optional): Key columns, required for `LoadStrategy.MERGE`. Defaults to None.
+            merge_partition_column (str | None, optional): Destination partitioning column used to prune the MERGE. Defaults to None.
+        """
 
         self.raise_for_invalid_table_fqn(dst_table_fqn)
 
-        logger.debug(f"Loading CSV from {src_gcs_uri} into {dst_table_fqn} ...")
+        if load_strategy == LoadStrategy.MERGE and not merge_keys:
+            raise ValueError("merge_keys must be provided if using LoadStrategy.MERGE")
+
+        logger.debug(f"Loading {format} from {src_gcs_uri} into {dst_table_fqn} ...")
 
         # Construct LOAD options
         logger.debug("Constructing LOAD options ...")
@@ -306,18 +1107,37 @@ class BQ:
             load_options.append("  skip_leading_rows=1")
             load_options.append(f"  field_delimiter='{field_delimiter}'")
             load_options.append("  allow_quoted_newlines=true")
+        if format == DataFileFormat.PARQUET:
+            load_options.append("  enable_list_inference=true")
         if compression:
             load_options.append(f"  compression='{compression}'")
         load_options_str = ",\n".join(load_options)
 
+        # Merge into an existing table
+        if load_strategy == LoadStrategy.MERGE and self.is_table_exists(
+            dst_table_fqn, use_cache=True
+        ):
+            query = self._build_merge_load_query(
+                dst_table_fqn,
+                load_options_str,
+                schema,
+                merge_keys,
+                merge_partition_column,
+            )
+            logger.debug("Executing query ...")
+            self.execute_query(query)
+            return
+
         # Construct beautiful query string
         logger.debug("Constructing LOAD query ...")
-        schema_str = ",\n".join(
-            [f"  {column['name']} {column['data_type']}" for column in schema]
-        )
         query_parts = [
-            f"LOAD DATA {'OVERWRITE' if load_strategy == LoadStrategy.OVERWRITE else 'INTO'} `{dst_table_fqn}` (\n{schema_str}\n)"
+            f"LOAD DATA {'OVERWRITE' if load_strategy == LoadStrategy.OVERWRITE else 'INTO'} `{dst_table_fqn}`"
         ]
+        if schema:
+            schema_str = ",\n".join(
+                [f"  {column['name']} {column['data_type']}" for column in schema]
+            )
+            query_parts[0] += f" (\n{schema_str}\n)"
         if partition_by:
             query_parts.append(f"PARTITION BY {partition_by}")
         if clustering_fields:
@@ -331,6 +1151,7 @@ class BQ:
         # Execute
         logger.debug("Executing query ...")
         self.execute_query(query)
+        self.table_metadata_cache.mark_exists(dst_table_fqn)
 
     def export_data(
         self,
@@ -401,66 +1222,254 @@ class BQ:
         logger.debug("Executing query ...")
         self.execute_query(query=query, parameters=parameters)
 
-    def upload_csv(
+    def export_data_partitioned(
         self,
-        src_filepath: str,
-        dst_table_fqn: str,
-        schema: list[dict] | None = None,
-        gcs_bucket: str | None = None,
-        partition_by: str = None,
-        clustering_fields: list[str] = None,
+        query: str,
+        dst_gcs_prefix: str,
+        partition_column: str,
+        *,
+        partitions: list | None = None,
+        partition_range: tuple[datetime.date | str, datetime.date | str] | None = None,
+        partition_level: Level | None = None,
+        parameters: dict = {},
+        format: DataFileFormat = DataFileFormat.CSV,
         compression: DataFileCompression | None = None,
-        load_strategy: LoadStrategy = LoadStrategy.APPEND,
-    ):
-        from . import cloudstorage
-        from . import dttm
-        from . import string
+        header: bool = True,
+        delimiter: str = ",",
+        max_concurrency: int = 8,
+        materialize: bool = False,
+    ) -> list[str]:
+        """Export a query with one concurrent EXPORT job per partition, into a Hive style `<dst_gcs_prefix>/<partition_column>=<value>/` layout
 
-        self.raise_for_invalid_table_fqn(dst_table_fqn)
+        A `_SUCCESS` marker is written into each partition once its export completes, partitions which already have one are skipped so an interrupted export can be resumed.
 
-        if compression == DataFileCompression.GZIP and not src_filepath.endswith(".gz"):
-            raise ValueError(
-                "Please provide file path with .gz extension if using compression = GZIP"
-            )
-        elif not src_filepath.endswith(".csv"):
-            raise ValueError("Please provide file path with .csv extension")
+        Args:
+            query (str): Source query
+            dst_gcs_prefix (str): Destination, `gs://<bucket>/<path>`
+            partition_column (str): Column to partition by, it is excluded from the exported files
+            partitions (list | None, optional): Partition values to export. Defaults to None.
+            partition_range (tuple[datetime.date | str, datetime.date | str] | None, optional): Inclusive date range to export, expanded with `dttm.generate_dates`. Defaults to None.
+            partition_level (Level | None, optional): Granularity of `partition_range`. Defaults to Level.DAY.
+            parameters (dict, optional): Query parameters. Defaults to {}.
+            format (DataFileFormat, optional): File format. Defaults to DataFileFormat.CSV.
+            compression (DataFileCompression | None, optional): File compression. Defaults to None.
+            header (bool, optional): Write CSV header. Defaults to True.
+            delimiter (str, optional): CSV delimiter. Defaults to ",".
+            max_concurrency (int, optional): Maximum number of EXPORT jobs running at the same time. Defaults to 8.
+            materialize (bool, optional): Run an expensive query once into a scratch table clustered by `partition_column` instead of once per partition, see `scratch`. Defaults to False.
 
-        src_filename, src_fileextension = os.path.splitext(src_filepath)
-        src_filename = os.path.basename(src_filename)  # Only get filename
+        Returns:
+            list[str]: Partition prefixes, in the order of the partitions
+        """
 
-        # # <<----- START: Upload to GCS
+        from . import clients
+        from . import dttm
 
-        # gcs = GCS(self.project_id)
-        # tmp_dir = f'tmp/upload__{current_datetime_str()}'
+        if (partitions is None) == (partition_range is None):
+            raise ValueError("Provide either partitions or partition_range")
+        if partition_range is not None:
+            partitions = dttm.generate_dates(
+                *partition_range, partition_level or dttm.Level.DAY
+            )
+        if not partitions:
+            raise ValueError("partitions cannot be empty")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if not dst_gcs_prefix.startswith("gs://"):
+            raise ValueError("dst_gcs_prefix must start with gs://")
+        if "_partition" in parameters or "_partitions" in parameters:
+            raise ValueError("_partition and _partitions are reserved query parameters")
+
+        bucket, _, dst_dirpath = dst_gcs_prefix.removeprefix("gs://").partition("/")
+        dst_dirpath = dst_dirpath.strip("/")
+        gcs_client = clients.get_gcs(bucket, self.client.project)
+
+        file_pattern = f"*.{str(format).lower()}"
+        if compression == DataFileCompression.GZIP and format in (
+            DataFileFormat.CSV,
+            DataFileFormat.JSON,
+        ):
+            file_pattern += ".gz"
 
-        # # This will compress while splitting the compressed file to a certain bytes size because of GCS 4GB file limitation
-        # # A single file can produce more than one compressed file in GCS
-        # def producer(src_file: str):
-        #     for dst_file in compress(src_file,
-        # keep=True, max_size_bytes=ByteSize.GB * 3):
-        #         yield (dst_file, )
+        def _get_partition_dirpath(value) -> str:
+            value_str = value.isoformat() if isinstance(value, datetime.date) else value
+            return "/".join(
+                x for x in (dst_dirpath, f"{partition_column}={value_str}") if x
+            )
 
-        # def consumer(dst_file: str):
-        #     remote_file_name = f'{tmp_dir}/{replace_nonnumeric(os.path.basename(dst_file), "_").lower()}.csv.gz'
-        #     logger.debug(f'Uploading {dst_file} to {remote_file_name}...')
-        #     blob = gcs.upload(dst_file, remote_file_name, move=True)
-        #     return blob
+        # Skip partitions exported by a previous run
+        done = {
+            blob.name
+            for blob in gcs_client.list_blobs(dst_dirpath)
+            if blob.name.endswith("/_SUCCESS")
+        }
+        pending = [
+            value
+            for value in partitions
+            if f"{_get_partition_dirpath(value)}/_SUCCESS" not in done
+        ]
+        logger.info(
+            f"[Partitions] {len(partitions)}, [Exported] {len(partitions) - len(pending)}, [Pending] {len(pending)}"
+        )
+
+        # Run the query once for all pending partitions, each EXPORT then only reads its own cluster
+        if materialize and pending:
+            with self.scratch() as scratch:
+                src_table_fqn = scratch.create_table(
+                    f"SELECT * FROM (\n{textwrap.dedent(query).strip()}\n)\nWHERE `{partition_column}` IN UNNEST(@_partitions)",
+                    {**parameters, "_partitions": pending},
+                    prefix="export",
+                    clustering_fields=[partition_column],
+                )
+            query, parameters = f"SELECT * FROM `{src_table_fqn}`", {}
+
+        partition_query = f"SELECT * EXCEPT (`{partition_column}`)\nFROM (\n{textwrap.dedent(query).strip()}\n)\nWHERE `{partition_column}` = @_partition"
+
+        def _export(value):
+            partition_dirpath = _get_partition_dirpath(value)
+            self.export_data(
+                partition_query,
+                f"gs://{bucket}/{partition_dirpath}/{file_pattern}",
+                parameters={**parameters, "_partition": value},
+                format=format,
+                compression=compression,
+                header=header,
+                delimiter=delimiter,
+            )
+            gcs_client.upload_bytes(b"", f"{partition_dirpath}/_SUCCESS")
+            logger.debug(f"Exported partition {partition_column}={value}")
 
-        # blobs: list[storage.Blob]
-        # _, blobs = ThreadingQ().add_producer(producer, src_filename).add_consumer(consumer).execute()
+        t = time.time()
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [executor.submit(_export, value) for value in pending]
+            try:
+                for future in futures:
+                    future.result()
+            except:
+                executor.shutdown(cancel_futures=True)  # Stop queued exports
+                raise
+        logger.info(
+            f"[Exported] {len(pending)} partition(s), [Elapsed] {_humanize_precisedelta()(time.time() - t)}"
+        )
 
-        # # END: Upload to GCS ----->>
+        return [
+            f"gs://{bucket}/{_get_partition_dirpath(value)}/" for value in partitions
+        ]
+
+    def upload_csv(
+        self,
+        src_filepath: str,
+        dst_table_fqn: str,
+        schema: list[dict] | None = None,
+        gcs_bucket: str | None = None,
+        partition_by: str = None,
+        clustering_fields: list[str] = None,
+        compression: DataFileCompression | None = None,
+        load_strategy: LoadStrategy = LoadStrategy.APPEND,
+        *,
+        split_size_bytes: int | None = None,
+        max_workers: int = 8,
+        merge_keys: list[str] | None = None,
+        merge_partition_column: str | None = None,
+    ):
+        """Upload a local csv file to a BigQuery table through GCS
+
+        Args:
+            src_filepath (str): Local csv file, must end with .csv, or .gz if `compression` is GZIP
+            dst_table_fqn (str): Destination table
+            schema (list[dict] | None, optional): Table schema, auto detected if not provided. Defaults to None.
+            gcs_bucket (str | None, optional): Bucket used as staging area. Defaults to None.
+            partition_by (str, optional): Partition column. Defaults to None.
+            clustering_fields (list[str], optional): Clustering columns. Defaults to None.
+            compression (DataFileCompression | None, optional): Compression of the source file. Defaults to None.
+            load_strategy (LoadStrategy, optional): Load strategy. Defaults to LoadStrategy.APPEND.
+            split_size_bytes (int | None, optional): Split an uncompressed source into gzip parts of this many raw bytes, parts are uploaded concurrently while the next ones are compressed and loaded with a single wildcard URI. Defaults to None (upload as a single file).
+            max_workers (int, optional): Maximum number of concurrent part uploads. Defaults to 8.
+            merge_keys (list[str] | None, optional): Key columns for `LoadStrategy.MERGE`, see `load_data`. Defaults to None.
+            merge_partition_column (str | None, optional): Partitioning column to prune `LoadStrategy.MERGE`, see `load_data`. Defaults to None.
+        """
+
+        from . import clients
+        from . import csv
+        from . import dttm
+        from . import string
+
+        self.raise_for_invalid_table_fqn(dst_table_fqn)
+
+        if compression == DataFileCompression.GZIP:
+            if not src_filepath.endswith(".gz"):
+                raise ValueError(
+                    "Please provide file path with .gz extension if using compression = GZIP"
+                )
+        elif not src_filepath.endswith(".csv"):
+            raise ValueError("Please provide file path with .csv extension")
+
+        if split_size_bytes is not None:
+            if compression is not None:
+                raise ValueError(
+                    "split_size_bytes can only be used with an uncompressed source"
+                )
+            if split_size_bytes < 1:
+                raise ValueError("split_size_bytes must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        src_filename, src_fileextension = os.path.splitext(src_filepath)
+        src_filename = os.path.basename(src_filename)  # Only get filename
+
+        gcs_client = clients.get_gcs(gcs_bucket, self.client.project)
+        dst_dirpath = f"tmp/my_bq/{dttm.get_current_datetime_str()}/{string.replace_nonnumeric(src_filename, '_').lower()}"
 
         # Upload to GCS
-        # TODO: Re-implement the producer-consumer model to upload multiple files
-        gcs_client = cloudstorage.GCS(bucket=gcs_bucket, project_id=self.client.project)
-        dst_blobpath = f"tmp/my_bq/{dttm.get_current_datetime_str()}/{string.replace_nonnumeric(src_filename, '_').lower()}{src_fileextension}"
-        gcs_client.upload(src_filepath, dst_blobpath)
+        if split_size_bytes is None:
+            dst_blobpaths = [f"{dst_dirpath}{src_fileextension}"]
+            gcs_client.upload(src_filepath, dst_blobpaths[0])
+            src_gcs_uri = f"gs://{gcs_client.bucket.name}/{dst_blobpaths[0]}"
+        else:
+            dst_blobpaths = []
+            src_gcs_uri = f"gs://{gcs_client.bucket.name}/{dst_dirpath}/*.csv.gz"
+            compression = DataFileCompression.GZIP
 
-        # Load to BQ
         try:
+            if split_size_bytes is not None:
+                # Compress parts sequentially while the finished ones are uploaded concurrently
+                t = time.time()
+                part_filepaths: list[str] = []
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = []
+                    try:
+                        for part_filepath in csv.compress(
+                            src_filepath, keep=True, max_size_bytes=split_size_bytes
+                        ):
+                            part_filepaths.append(part_filepath)
+                            dst_blobpaths.append(
+                                f"{dst_dirpath}/{len(dst_blobpaths):06}.csv.gz"
+                            )
+                            futures.append(
+                                executor.submit(
+                                    gcs_client.upload,
+                                    part_filepath,
+                                    dst_blobpaths[-1],
+                                    move=True,
+                                )
+                            )
+                        for future in futures:
+                            future.result()
+                    except:
+                        executor.shutdown(cancel_futures=True)  # Stop queued uploads
+                        raise
+                    finally:
+                        # Parts are moved on upload, only the failed ones are left behind
+                        for part_filepath in part_filepaths:
+                            if os.path.exists(part_filepath):
+                                os.remove(part_filepath)
+                logger.info(
+                    f"[Uploaded] {len(dst_blobpaths)} part(s), [Size] {_humanize_naturalsize()(os.path.getsize(src_filepath))}, [Elapsed] {_humanize_precisedelta()(time.time() - t)}"
+                )
+
+            # Load to BQ
             self.load_data(
-                f"gs://{gcs_client.bucket.name}/{dst_blobpath}",
+                src_gcs_uri,
                 dst_table_fqn,
                 schema=schema,
                 partition_by=partition_by,
@@ -468,11 +1477,290 @@ class BQ:
                 format=DataFileFormat.CSV,
                 compression=compression,
                 load_strategy=load_strategy,
+                merge_keys=merge_keys,
+                merge_partition_column=merge_partition_column,
             )
-        except:
-            raise
         finally:
-            gcs_client.delete_blob(dst_blobpath)
+            for dst_blobpath in dst_blobpaths:
+                try:
+                    gcs_client.delete_blob(dst_blobpath)
+                except Exception as e:
+                    logger.debug(f"Skip deleting {dst_blobpath}: {e}")  # Not uploaded
+
+    def upload_rows(
+        self,
+        rows: Iterable[dict | tuple | list],
+        dst_table_fqn: str,
+        schema: list[dict],
+        *,
+        gcs_bucket: str | None = None,
+        partition_by: str | None = None,
+        clustering_fields: list[str] | None = None,
+        load_strategy: LoadStrategy = LoadStrategy.APPEND,
+        chunk_size_bytes: int = ByteSize.MB * 128,
+        batch_size: int = 10_000,
+        max_workers: int = 4,
+        merge_keys: list[str] | None = None,
+        merge_partition_column: str | None = None,
+    ) -> int:
+        """Upload rows produced in Python to a BigQuery table without an intermediate file
+
+        Rows are buffered into in-memory Parquet chunks, each chunk is uploaded to GCS as soon as it is full, and all chunks are loaded with a single LOAD DATA.
+        Memory stays bounded by `chunk_size_bytes` times the number of chunks in flight, regardless of the number of rows.
+
+        Args:
+            rows (Iterable[dict | tuple | list]): Rows as dicts keyed by column name, or sequences in schema order
+            dst_table_fqn (str): Destination table
+            schema (list[dict]): Table schema, list of {'name': ..., 'data_type': ...}, see `Dtype`
+            gcs_bucket (str | None, optional): Bucket used as staging area. Defaults to None.
+            partition_by (str | None, optional): Partition column. Defaults to None.
+            clustering_fields (list[str] | None, optional): Clustering columns. Defaults to None.
+            load_strategy (LoadStrategy, optional): Load strategy. Defaults to LoadStrategy.APPEND.
+            chunk_size_bytes (int, optional): Parquet chunk size before it is uploaded. Defaults to 128 MB.
+            batch_size (int, optional): Rows per Parquet row group. Defaults to 10_000.
+            max_workers (int, optional): Maximum number of chunks being uploaded at the same time. Defaults to 4.
+            merge_keys (list[str] | None, optional): Key columns for `LoadStrategy.MERGE`, see `load_data`. Defaults to None.
+            merge_partition_column (str | None, optional): Partitioning column to prune `LoadStrategy.MERGE`, see `load_data`. Defaults to None.
+
+        Returns:
+            int: Number of uploaded rows
+        """
+
+        from . import clients
+
+        pyarrow = import_module_cached("pyarrow")
+        pq = import_module_cached("pyarrow.parquet")
+
+        self.raise_for_invalid_table_fqn(dst_table_fqn)
+
+        if not schema:
+            raise ValueError("schema must be provided")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        names = [column["name"] for column in schema]
+        arrow_schema = pyarrow.schema(
+            [
+                (column["name"], _to_pyarrow_type(column["data_type"]))
+                for column in schema
+            ]
+        )
+
+        gcs_client = clients.get_gcs(gcs_bucket, self.client.project)
+        dst_dirpath = gcs_client.build_tmp_dirpath("tmp/my_bq")
+        dst_blobpaths: list[str] = []
+
+        t = time.time()
+        n_rows = 0
+        n_bytes = 0
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = set()
+
+                def _upload_chunk(sink: pyarrow_types.BufferOutputStream):
+                    nonlocal n_bytes
+                    data = sink.getvalue().to_pybytes()
+                    n_bytes += len(data)
+
+                    # Block until a slot is free, so at most max_workers chunks are held in memory
+                    while len(pending) >= max_workers:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            pending.remove(future)
+                            future.result()
+
+                    dst_blobpaths.append(
+                        f"{dst_dirpath}/{len(dst_blobpaths):06}.parquet"
+                    )
+                    pending.add(
+                        executor.submit(
+                            gcs_client.upload_bytes, data, dst_blobpaths[-1]
+                        )
+                    )
+
+                def _write_batch(writer, batch: list):
+                    columns = (
+                        [[row.get(name) for row in batch] for name in names]
+                        if isinstance(batch[0], dict)
+                        else [list(column) for column in zip(*batch)]
+                    )
+                    if len(columns) != len(names):
+                        raise ValueError(
+                            f"Row has {len(columns)} column(s), schema has {len(names)}"
+                        )
+                    writer.write_batch(
+                        pyarrow.RecordBatch.from_arrays(
+                            [
+                                pyarrow.array(column, type=field.type)
+                                for column, field in zip(columns, arrow_schema)
+                            ],
+                            schema=arrow_schema,
+                        )
+                    )
+
+                try:
+                    sink = pyarrow.BufferOutputStream()
+                    writer = pq.ParquetWriter(sink, arrow_schema)
+                    batch = []
+                    n_rows_uploaded = 0
+                    for row in rows:
+                        batch.append(row)
+                        if len(batch) < batch_size:
+                            continue
+
+                        _write_batch(writer, batch)
+                        n_rows += len(batch)
+                        batch = []
+                        if sink.tell() >= chunk_size_bytes:
+                            writer.close()
+                            _upload_chunk(sink)
+                            n_rows_uploaded = n_rows
+                            sink = pyarrow.BufferOutputStream()
+                            writer = pq.ParquetWriter(sink, arrow_schema)
+
+                    # Last chunk, always uploaded when there is no other so an empty iterable still creates the table
+                    if batch:
+                        _write_batch(writer, batch)
+                        n_rows += len(batch)
+                    writer.close()
+                    if n_rows > n_rows_uploaded or not dst_blobpaths:
+                        _upload_chunk(sink)
+
+                    for future in pending:
+                        future.result()
+                except:
+                    executor.shutdown(cancel_futures=True)  # Stop queued uploads
+                    raise
+
+            logger.info(
+                f"[Uploaded] {n_rows} row(s) in {len(dst_blobpaths)} chunk(s), [Size] {_humanize_naturalsize()(n_bytes)}, [Elapsed] {_humanize_precisedelta()(time.time() - t)}"
+            )
+
+            # Load to BQ
+            self.load_data(
+                f"gs://{gcs_client.bucket.name}/{dst_dirpath}/*.parquet",
+                dst_table_fqn,
+                schema=schema,
+                partition_by=partition_by,
+                clustering_fields=clustering_fields,
+                format=DataFileFormat.PARQUET,
+                load_strategy=load_strategy,
+                merge_keys=merge_keys,
+                merge_partition_column=merge_partition_column,
+            )
+        finally:
+            for dst_blobpath in dst_blobpaths:
+                try:
+                    gcs_client.delete_blob(dst_blobpath)
+                except Exception as e:
+                    logger.debug(f"Skip deleting {dst_blobpath}: {e}")  # Not uploaded
+
+        return n_rows
+
+    def insert_many(
+        self,
+        dst_table_fqn: str,
+        rows: list[dict],
+        *,
+        batch_size: int = 1_000,
+    ) -> int:
+        """Insert rows with parameterized DML, packing each batch into one array-of-struct parameter so a batch is a single job
+
+        Column types are inferred from the values (see `PY_DATA_TYPE__BQ_DATA_TYPE`), columns which are NULL (or empty arrays) in every row use the destination table schema.
+
+        Args:
+            dst_table_fqn (str): Destination table, must exist
+            rows (list[dict]): Rows keyed by column name, all rows must have the same keys
+            batch_size (int, optional): Rows per INSERT job, keep the request below the 10 MB limit. Defaults to 1_000.
+
+        Returns:
+            int: Number of inserted rows
+        """
+
+        bigquery = import_module_cached("google.cloud.bigquery")
+
+        self.raise_for_invalid_table_fqn(dst_table_fqn)
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if not rows:
+            return 0
+
+        columns = list(rows[0].keys())
+        for row in rows:
+            if list(row.keys()) != columns:
+                raise ValueError(
+                    f"All rows must have the same columns: {columns}, got {list(row.keys())}"
+                )
+
+        # Type every column once, so all batches share the same struct type
+        types = {}
+        for column in columns:
+            # Empty arrays carry no element type, look further
+            value = next(
+                (row[column] for row in rows if row[column] not in (None, [])), None
+            )
+            if value is None:
+                continue
+            types[column] = (
+                f"ARRAY<{self._get_bq_data_type(column, value[0])}>"
+                if isinstance(value, list)
+                else self._get_bq_data_type(column, value)
+            )
+        if len(types) != len(columns):
+            table_schema = {
+                c["name"]: c["data_type"]
+                for c in self.get_table_metadata(dst_table_fqn)["schema"]
+            }
+            for column in columns:
+                if column in types:
+                    continue
+                if column not in table_schema:
+                    raise ValueError(
+                        f"Column {column} is NULL or empty in every row and does not exist in {dst_table_fqn}"
+                    )
+                if "STRUCT<" in table_schema[column]:
+                    raise ValueError(
+                        f"Column {column} is a STRUCT and NULL or empty in every row, its type cannot be passed as a query parameter"
+                    )
+                # Parameter types take no precision / length, e.g. NUMERIC(10, 2) -> NUMERIC
+                types[column] = re.sub(r"\([^)]*\)", "", table_schema[column])
+
+        def _build_field(column: str, value):
+            if types[column].startswith("ARRAY<"):
+                return bigquery.ArrayQueryParameter(
+                    column, types[column][6:-1], value or []
+                )
+            return bigquery.ScalarQueryParameter(column, types[column], value)
+
+        columns_str = ", ".join(f"`{column}`" for column in columns)
+        query = (
+            f"INSERT INTO `{dst_table_fqn}` ({columns_str}) SELECT * FROM UNNEST(@rows)"
+        )
+        for i in range(0, len(rows), batch_size):
+            batch = rows[i : i + batch_size]
+            self.execute_query(
+                query,
+                {
+                    "rows": bigquery.ArrayQueryParameter(
+                        "rows",
+                        "STRUCT",
+                        [
+                            bigquery.StructQueryParameter(
+                                None, *[_build_field(c, row[c]) for c in columns]
+                            )
+                            for row in batch
+                        ],
+                    )
+                },
+            )
+            logger.debug(
+                f"Inserted {i + len(batch)}/{len(rows)} row(s) into {dst_table_fqn}"
+            )
+
+        return len(rows)
 
     def download_csv(
         self,
@@ -482,121 +1770,61 @@ class BQ:
         gcs_bucket: str | None = None,
         query_parameters: dict = {},
         csv_row_limit: int | None = None,
+        max_workers: int = 8,
+        method: DownloadMethod = DownloadMethod.EXPORT,
+        max_stream_count: int = 4,
     ) -> str | list[str]:
-        from . import cloudstorage
+        from . import clients
         from . import csv
-        from . import dttm
 
-        if not dst_filepath.endswith(".csv"):
-            raise ValueError("Destination filename must ends with .csv")
+        if not dst_filepath.endswith((".csv", ".csv.gz")):
+            raise ValueError("Destination filename must ends with .csv or .csv.gz")
 
-        # Init
-        gcs_client = cloudstorage.GCS(bucket=gcs_bucket, project_id=self.client.project)
-
-        # Generic function to export-download-combine csv file from BQ->GCS->local
-        def _export_download_combine(
-            query: str,
-            dst_gcs_prefix: str,
-            dst_filepath: str,
-            query_parameters: dict = {},
-        ):
-            # Init tmp directory
-            tmp_dirname = f"/tmp/my_bq_{dttm.get_current_datetime_str()}"
-            if os.path.exists(tmp_dirname):
-                shutil.rmtree(tmp_dirname, ignore_errors=True)
-            os.makedirs(tmp_dirname, exist_ok=True)
-            logger.debug(f"Temporary directory created: {tmp_dirname}")
-
-            try:
-                # Export to GCS
-                dst_gcs_uri = f"gs://{gcs_client.bucket.name}/{dst_gcs_prefix}/*.csv.gz"
-                self.export_data(
-                    query,
-                    dst_gcs_uri,
-                    parameters=query_parameters,
-                    format=DataFileFormat.CSV,
-                    compression=DataFileCompression.GZIP,
+        # Storage Read API, no GCS round trip
+        if method == DownloadMethod.STORAGE_READ:
+            if csv_row_limit:
+                raise ValueError(
+                    "csv_row_limit is only supported with DownloadMethod.EXPORT"
                 )
+            return self.download_stream(
+                query,
+                dst_filepath,
+                parameters=query_parameters,
+                max_stream_count=max_stream_count,
+            )
 
-                # Download from GCS
-                local_tmp_filepaths = []
-                for tmp_blobs in gcs_client.list_blobs(dst_gcs_prefix):
-                    local_tmp_filepath = os.path.join(
-                        tmp_dirname, tmp_blobs.name.split("/")[-1]
-                    )
-                    gcs_client.download(tmp_blobs, local_tmp_filepath, move=True)
-                    # logger.debug(f'Downloaded {tmp_blobs.name} to {local_tmp_filepath}')
-                    local_tmp_filepaths.append(local_tmp_filepath)
-
-                # Combine downloaded files
-                csv.combine(local_tmp_filepaths, dst_filepath, gzip=True, delete=True)
-            except:
-                raise
-            finally:
-                shutil.rmtree(tmp_dirname, ignore_errors=True)  # Remove local folder
-                [
-                    gcs_client.delete_blob(blob_filepath)
-                    for blob_filepath in gcs_client.list_blobs(dst_gcs_prefix)
-                ]  # Remove temporary GCS files
+        # Init
+        gcs_client = clients.get_gcs(gcs_bucket, self.client.project)
 
-            logger.info(f"Export-download-combine done: {dst_filepath}")
+        # Init tmp directory
+        tmp_dirname = tempfile.mkdtemp(prefix="my_bq_")
+        logger.debug(f"Temporary directory created: {tmp_dirname}")
 
-        # Limited csv rows
-        if csv_row_limit:
-            tmp_table_fqn: str | None = None
-            tmp_table_fqn_rn: str | None = None
-            try:
-                # Create temporary table
-                query_job = self.execute_query(query, temporary_table=True)
-                tmp_table_fqn = str(query_job.destination)
-                logger.debug(f"Create temp table: {tmp_table_fqn}")
-
-                # Create another temporary table for row numbering
-                query_job = self.execute_query(
-                    f"SELECT *, ROW_NUMBER() OVER() AS _rn FROM `{tmp_table_fqn}`",
-                    temporary_table=True,
-                )
-                tmp_table_fqn_rn = str(query_job.destination)
-                logger.debug(f"Create temp table (rn): {tmp_table_fqn_rn}")
-
-                # Process parts
-                count = list(
-                    self.execute_query(
-                        f"SELECT COUNT(1) FROM `{tmp_table_fqn_rn}`"
-                    ).result()
-                )[0][0]
-                parts = math.ceil(count / csv_row_limit)
-                logger.info(f"Total part: {count} / {csv_row_limit} = {parts}")
-                dst_filepaths = []
-                for part in range(parts):
-                    dst_filepath_part = (
-                        f"{dst_filepath.removesuffix('.csv')}_{part + 1:06}.csv"
-                    )
-                    _export_download_combine(
-                        f"SELECT * EXCEPT(_rn) FROM `{tmp_table_fqn_rn}` WHERE _rn BETWEEN {(part * csv_row_limit) + 1} AND {(part + 1) * csv_row_limit} ORDER BY _rn",
-                        dst_gcs_prefix=gcs_client.build_tmp_dirpath(),
-                        dst_filepath=dst_filepath_part,
-                    )
-                    dst_filepaths.append(dst_filepath_part)
-                return dst_filepaths
-            except:
-                raise
-            finally:
-                # Drop temporary tables
-                if tmp_table_fqn_rn:
-                    self.drop_table(tmp_table_fqn_rn)
-                if tmp_table_fqn:
-                    self.drop_table(tmp_table_fqn)
-
-        # Unlimited csv rows
-        else:
-            _export_download_combine(
+        try:
+            # Export and download shards
+            local_tmp_filepaths = self._export_download(
                 query,
-                gcs_client.build_tmp_dirpath(),
+                tmp_dirname,
+                gcs_client,
+                parameters=query_parameters,
+                format=DataFileFormat.CSV,
+                max_workers=max_workers,
+            )
+
+            # Combine downloaded files, split into parts locally if limited csv rows
+            dst_filepaths = csv.stream_combine(
+                local_tmp_filepaths,
                 dst_filepath,
-                query_parameters=query_parameters,
+                delete=True,
+                row_limit=csv_row_limit,
             )
-            return dst_filepath
+        except:
+            raise
+        finally:
+            shutil.rmtree(tmp_dirname, ignore_errors=True)  # Remove local folder
+
+        logger.info(f"Export-download-combine done: {dst_filepaths}")
+        return dst_filepaths
 
         # query_job_result = query_job.result()
         # row_count = 0
@@ -627,85 +1855,677 @@ class BQ:
         # if f:
         #     f.close()
 
+    def download_parquet(
+        self,
+        query: str,
+        dst_path: str,
+        *,
+        gcs_bucket: str | None = None,
+        query_parameters: dict = {},
+        max_workers: int = 8,
+        method: DownloadMethod = DownloadMethod.EXPORT,
+        max_stream_count: int = 4,
+    ) -> str | list[str]:
+        """Download a query result as Parquet, without any CSV round trip
+
+        Args:
+            query (str): The query
+            dst_path (str): Either a `.parquet` file to merge all shards into, or a directory (ends with the path separator) to keep the shards as a dataset
+            gcs_bucket (str | None, optional): Bucket for the temporary export. Defaults to GCS_BUCKET env.
+            query_parameters (dict, optional): Query parameters. Defaults to {}.
+            max_workers (int, optional): Maximum number of concurrent shard downloads. Defaults to 8.
+            method (DownloadMethod, optional): Download method, STORAGE_READ only supports a single file. Defaults to DownloadMethod.EXPORT.
+            max_stream_count (int, optional): Maximum number of read streams for STORAGE_READ, 1 if the query has ORDER BY. Defaults to 4.
+
+        Returns:
+            str | list[str]: The merged file path, or the shard file paths if `dst_path` is a directory
+        """
+
+        from . import clients
+        from . import parquet
+
+        is_dataset = dst_path.endswith(os.sep)
+        if not is_dataset and not dst_path.endswith(".parquet"):
+            raise ValueError(
+                f"Destination must be a .parquet file or a directory ending with '{os.sep}'"
+            )
+
+        # Storage Read API, no GCS round trip
+        if method == DownloadMethod.STORAGE_READ:
+            if is_dataset:
+                raise ValueError(
+                    "DownloadMethod.STORAGE_READ only supports a single .parquet file"
+                )
+            return self.download_stream(
+                query,
+                dst_path,
+                parameters=query_parameters,
+                max_stream_count=max_stream_count,
+            )
+
+        gcs_client = clients.get_gcs(gcs_bucket, self.client.project)
+
+        # Keep shards as a dataset directory
+        if is_dataset:
+            os.makedirs(dst_path, exist_ok=True)
+            return self._export_download(
+                query,
+                dst_path,
+                gcs_client,
+                parameters=query_parameters,
+                format=DataFileFormat.PARQUET,
+                max_workers=max_workers,
+            )
+
+        # Merge shards into a single file
+        tmp_dirname = tempfile.mkdtemp(prefix="my_bq_")
+        try:
+            local_tmp_filepaths = self._export_download(
+                query,
+                tmp_dirname,
+                gcs_client,
+                parameters=query_parameters,
+                format=DataFileFormat.PARQUET,
+                max_workers=max_workers,
+            )
+            parquet.combine(local_tmp_filepaths, dst_path, delete=True)
+        finally:
+            shutil.rmtree(tmp_dirname, ignore_errors=True)
+
+        logger.info(f"Export-download-combine done: {dst_path}")
+        return dst_path
+
+    def download_arrow(
+        self,
+        query: str,
+        *,
+        gcs_bucket: str | None = None,
+        query_parameters: dict = {},
+        max_workers: int = 8,
+        method: DownloadMethod = DownloadMethod.EXPORT,
+        max_stream_count: int = 4,
+        iterator: bool = False,
+    ) -> pyarrow_types.Table | Iterator[pyarrow_types.RecordBatch]:
+        """Download a query result as an Arrow table, or an iterator of record batches when `iterator=True`
+
+        With DownloadMethod.EXPORT the result goes through temporary Parquet shards, in iterator mode each shard is deleted once read.
+        """
+
+        from . import clients
+
+        pyarrow = import_module_cached("pyarrow")
+        pq = import_module_cached("pyarrow.parquet")
+
+        # Storage Read API, no GCS round trip
+        if method == DownloadMethod.STORAGE_READ:
+            session = self._create_query_read_session(
+                query, query_parameters, max_stream_count
+            )
+            batches = self._read_session_batches(session)
+            if iterator:
+                return batches
+            return pyarrow.Table.from_batches(
+                list(batches), schema=self._read_session_schema(session)
+            )
+
+        gcs_client = clients.get_gcs(gcs_bucket, self.client.project)
+        tmp_dirname = tempfile.mkdtemp(prefix="my_bq_")
+
+        def _download() -> list[str]:
+            return self._export_download(
+                query,
+                tmp_dirname,
+                gcs_client,
+                parameters=query_parameters,
+                format=DataFileFormat.PARQUET,
+                max_workers=max_workers,
+            )
+
+        if not iterator:
+            try:
+                return pq.read_table(_download())
+            finally:
+                shutil.rmtree(tmp_dirname, ignore_errors=True)
+
+        def _iter_batches() -> Iterator[pyarrow_types.RecordBatch]:
+            try:
+                for local_tmp_filepath in _download():
+                    yield from pq.ParquetFile(local_tmp_filepath).iter_batches()
+                    os.remove(local_tmp_filepath)
+            finally:
+                shutil.rmtree(tmp_dirname, ignore_errors=True)
+
+        return _iter_batches()
+
+    def stream_query(
+        self,
+        query: str,
+        *,
+        parameters: dict = {},
+        max_stream_count: int = 4,
+    ) -> Iterator[pyarrow_types.RecordBatch]:
+        """Run a query and stream its result table as Arrow record batches, read through parallel Storage Read API streams
+
+        Batches from different streams are interleaved, a query with ORDER BY is read through a single stream to keep its row order.
+
+        Args:
+            query (str): The query, a single statement
+            parameters (dict, optional): Query parameters. Defaults to {}.
+            max_stream_count (int, optional): Maximum number of read streams (and reader threads), 1 if the query has ORDER BY. Defaults to 4.
+
+        Yields:
+            pyarrow.RecordBatch: Result batches
+        """
+
+        session = self._create_query_read_session(query, parameters, max_stream_count)
+        yield from self._read_session_batches(session)
+
+    def download_stream(
+        self,
+        query: str,
+        dst_filepath: str,
+        *,
+        parameters: dict = {},
+        max_stream_count: int = 4,
+    ) -> str:
+        """Download a query result through the Storage Read API into a local `.csv`, `.csv.gz` or `.parquet` file
+
+        Args:
+            query (str): The query, a single statement
+            dst_filepath (str): Destination file, the format follows its extension
+            parameters (dict, optional): Query parameters. Defaults to {}.
+            max_stream_count (int, optional): Maximum number of read streams, 1 if the query has ORDER BY. Defaults to 4.
+
+        Returns:
+            str: The destination file path
+        """
+
+        pyarrow = import_module_cached("pyarrow")
+
+        if not dst_filepath.endswith((".csv", ".csv.gz", ".parquet")):
+            raise ValueError(
+                "Destination filename must ends with .csv, .csv.gz or .parquet"
+            )
+
+        t = time.time()
+        session = self._create_query_read_session(query, parameters, max_stream_count)
+        schema = self._read_session_schema(session)
+
+        # Open writer based on the file extension
+        if dst_filepath.endswith(".parquet"):
+            writer = import_attr_cached("pyarrow.parquet", "ParquetWriter")(
+                dst_filepath, schema
+            )
+        else:
+            sink = (
+                pyarrow.CompressedOutputStream(dst_filepath, "gzip")
+                if dst_filepath.endswith(".gz")
+                else dst_filepath
+            )
+            writer = import_attr_cached("pyarrow.csv", "CSVWriter")(sink, schema)
+
+        # Write batches as they arrive
+        rows = 0
+        try:
+            for batch in self._read_session_batches(session):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        finally:
+            writer.close()
+
+        elapsed = time.time() - t
+        logger.info(
+            f"[Streamed] {rows} row(s) into {dst_filepath}, [Streams] {len(session.streams)}, [Throughput] {rows / elapsed if elapsed else 0:.0f} row(s)/s, [Elapsed] {_humanize_precisedelta()(datetime.timedelta(seconds=elapsed))}"
+        )
+        return dst_filepath
+
     def download_xlsx(
-        self, src_table_fqn: str, dst_filename: str, xlsx_row_limit: int = 950000
-    ):
-        from . import xlsx
+        self,
+        src_table_fqn: str,
+        dst_filename: str,
+        xlsx_row_limit: int = 950000,
+        *,
+        gcs_bucket: str | None = None,
+        max_workers: int = 8,
+        max_convert_workers: int = 1,
+    ) -> list[str]:
+        """Download a table into XLSX file(s) of at most `xlsx_row_limit` rows each, named `<name>_000001.xlsx`, `<name>_000002.xlsx`, ...
+
+        The table is exported once, shards are downloaded concurrently, and each CSV part is converted as soon as the combine step completes it.
+        With `max_convert_workers` above 1 parts are converted in a spawned process pool, which re-imports the caller's `__main__`: the calling script must keep its top-level code under `if __name__ == "__main__":`, otherwise every worker runs it again.
+
+        Args:
+            src_table_fqn (str): Source table FQN
+            dst_filename (str): Destination file name, ends with `.xlsx`
+            xlsx_row_limit (int, optional): Maximum rows per XLSX file. Defaults to 950000.
+            gcs_bucket (str | None, optional): Bucket for the temporary export. Defaults to GCS_BUCKET env.
+            max_workers (int, optional): Maximum number of concurrent shard downloads. Defaults to 8.
+            max_convert_workers (int, optional): Number of XLSX conversion processes, 1 converts in this process. Defaults to 1.
+
+        Returns:
+            list[str]: The XLSX file paths
+        """
+
+        from . import clients
+        from . import csv
 
         if not dst_filename.endswith(".xlsx"):
             raise ValueError("Destination filename must ends with .xlsx!")
+        self.raise_for_invalid_table_fqn(src_table_fqn)
 
-        # Create a temporary table acting as excel file splitting
-        table_name_tmp = f"{src_table_fqn}_"
-        self.execute_query(
-            f"CREATE TABLE `{table_name_tmp}` AS SELECT *, ROW_NUMBER() OVER() AS _rn FROM `{src_table_fqn}`"
-        )
+        if max_convert_workers < 1:
+            raise ValueError("max_convert_workers must be at least 1")
+
+        naturalsize = _humanize_naturalsize()
+        cpu_count = multiprocessing.cpu_count()
+        dst_basename = dst_filename.removesuffix(".xlsx")
+        gcs_client = clients.get_gcs(gcs_bucket, self.client.project)
+
+        # Init tmp directory
+        tmp_dirname = tempfile.mkdtemp(prefix="my_bq_")
+        logger.debug(f"Temporary directory created: {tmp_dirname}")
 
         try:
-            # Calculate the number of excel file parts based on row limit
-            cnt = list(
-                self.execute_query(
-                    f"SELECT COUNT(1) AS cnt FROM `{src_table_fqn}`"
-                ).result()
-            )[0][0]
-            parts = math.ceil(cnt / xlsx_row_limit)
-            logger.debug(f"Total part: {cnt} / {xlsx_row_limit} = {parts}")
-
-            # Download per parts
-            for part in range(parts):
-                logger.debug(f"Downloading part {part + 1}...")
-                file_path_tmp = f"{dst_filename}_part{part + 1}"
-                file_path_tmp_csv = f"{file_path_tmp}.csv"
-                self.download_csv(
-                    f"SELECT * EXCEPT(_rn) FROM `{table_name_tmp}` WHERE _rn BETWEEN {(part * xlsx_row_limit) + 1} AND {(part + 1) * xlsx_row_limit}",
-                    f"{file_path_tmp}{os.sep}",
+            # Stage 1: export the table once and download the shards concurrently, no scratch table needed
+            local_tmp_filepaths = self._export_download(
+                f"SELECT * FROM `{src_table_fqn}`",
+                tmp_dirname,
+                gcs_client,
+                format=DataFileFormat.CSV,
+                max_workers=max_workers,
+            )
+
+            # Stage 2 & 3: split into CSV parts locally, convert each finished part in a process pool
+            t = time.time()
+            csv_size = 0
+            dst_filepaths: list[str] = []
+            futures = []
+            convert_elapsed_per_part: list[float] = []
+            with (
+                ProcessPoolExecutor(
+                    max_workers=max_convert_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                if max_convert_workers > 1
+                else nullcontext()
+            ) as executor:
+                for part, tmp_filepath_csv in enumerate(
+                    csv.stream_combine_parts(
+                        local_tmp_filepaths,
+                        os.path.join(tmp_dirname, "part.csv"),
+                        xlsx_row_limit,
+                        delete=True,
+                    ),
+                    start=1,
+                ):
+                    csv_size += os.path.getsize(tmp_filepath_csv)
+                    dst_filepath = f"{dst_basename}_{part:06}.xlsx"
+                    dst_filepaths.append(dst_filepath)
+                    if executor is None:
+                        convert_elapsed_per_part.append(
+                            _convert_csv_to_xlsx(
+                                tmp_filepath_csv, dst_filepath, cpu_count
+                            )
+                        )
+                        continue
+                    futures.append(
+                        executor.submit(
+                            _convert_csv_to_xlsx,
+                            tmp_filepath_csv,
+                            dst_filepath,
+                            max(1, cpu_count // max_convert_workers),
+                        )
+                    )
+                combine_elapsed = time.time() - t
+                logger.info(
+                    f"[Combine] {len(dst_filepaths)} part(s), [Size] {naturalsize(csv_size)}, [Throughput] {naturalsize(csv_size / combine_elapsed if combine_elapsed else 0)}/s, [Elapsed] {combine_elapsed:.2f}s"
                 )
-                xlsx.csv_to_xlsx(file_path_tmp_csv, f"{file_path_tmp}.xlsx")
-                os.remove(file_path_tmp_csv)
-        except Exception as e:
-            raise e
+
+                convert_elapsed_per_part += [future.result() for future in futures]
+            convert_elapsed = time.time() - t
+            logger.info(
+                f"[Convert] {len(dst_filepaths)} part(s), [Throughput] {naturalsize(csv_size / convert_elapsed if convert_elapsed else 0)}/s, [Slowest] {max(convert_elapsed_per_part, default=0):.2f}s, [Elapsed] {convert_elapsed:.2f}s"
+            )
+        except:
+            raise
         finally:
-            self.execute_query(f"DROP TABLE IF EXISTS `{table_name_tmp}`")
-
-    # def copy_view(self, src_view_id: str, dst_view_id: str, drop: bool = False):
-    #     src_project_id, src_dataset_id, _ = src_view_id.split('.')
-    #     dst_project_id, dst_dataset_id, _ = dst_view_id.split('.')
-
-    #     # Create or replace
-    #     src_view = self.client.get_table(src_view_id)
-    #     dst_view = bigquery.Table(dst_view_id)
-    #     dst_view.view_query = src_view.view_query.replace(f'{src_project_id}.{src_dataset_id}', f'{dst_project_id}.{dst_dataset_id}')
-    #     self.client.delete_table(dst_view, not_found_ok=True)
-    #     self.client.create_table(dst_view)
-    #     logger.debug(f'View {src_view_id} copied to {dst_view}')
-
-    #     if drop:
-    #         self.client.delete_table(src_view_id)
-    #         logger.debug(f'View {src_view_id} dropped')
-
-    # def copy_routine(self, src_routine_id: str, dst_routine_id: str, drop: bool = False):
-    #     src_project_id, src_dataset_id, _ = src_routine_id.split('.')
-    #     dst_project_id, dst_dataset_id, _ = dst_routine_id.split('.')
-
-    #     # Create or replace
-    #     src_routine = self.client.get_routine(src_routine_id)
-    #     dst_routine = bigquery.Routine(dst_routine_id)
-    #     dst_routine.body = src_routine.body.replace(f'{src_project_id}.{src_dataset_id}', f'{dst_project_id}.{dst_dataset_id}')
-    #     dst_routine.type_ = src_routine.type_
-    #     dst_routine.description = src_routine.description
-    #     dst_routine.language = src_routine.language
-    #     dst_routine.arguments = src_routine.arguments
-    #     dst_routine.return_type = src_routine.return_type
-    #     self.client.delete_routine(dst_routine, not_found_ok=True)
-    #     self.client.create_routine(dst_routine)
-    #     logger.debug(f'Routine {src_routine_id} copied to {dst_routine_id}')
-
-    #     if drop:
-    #         self.client.delete_routine(src_routine_id)
-    #         logger.debug(f'Routine {src_routine_id} dropped')
+            shutil.rmtree(tmp_dirname, ignore_errors=True)  # Remove local folder
+
+        return dst_filepaths
+
+    # MARK: Copy
+
+    def copy_table(self, src_table_fqn: str, dst_table_fqn: str, replace: bool = True):
+        """Copy a table with a copy job, which is free unlike `CREATE TABLE ... AS SELECT *`
+
+        Args:
+            src_table_fqn (str): Source table
+            dst_table_fqn (str): Destination table
+            replace (bool, optional): Overwrite the destination if it exists, otherwise fail. Defaults to True.
+        """
+
+        bigquery = import_module_cached("google.cloud.bigquery")
+
+        self.raise_for_invalid_table_fqn([src_table_fqn, dst_table_fqn])
+
+        job_config = bigquery.CopyJobConfig(
+            write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE
+            if replace
+            else bigquery.WriteDisposition.WRITE_EMPTY
+        )
+        self.client.copy_table(
+            src_table_fqn, dst_table_fqn, job_config=job_config
+        ).result()
+        self.table_metadata_cache.mark_exists(dst_table_fqn)
+        logger.debug(f"Table {src_table_fqn} copied to {dst_table_fqn}")
+
+    def copy_view(self, src_view_id: str, dst_view_id: str, drop: bool = False):
+        bigquery = import_module_cached("google.cloud.bigquery")
+
+        src_project_id, src_dataset_id, _ = self.get_table_fqn_parts(src_view_id)
+        dst_project_id, dst_dataset_id, _ = self.get_table_fqn_parts(dst_view_id)
+
+        # Create or replace
+        src_view = self.client.get_table(src_view_id)
+        dst_view = bigquery.Table(dst_view_id)
+        dst_view.view_query = src_view.view_query.replace(
+            f"{src_project_id}.{src_dataset_id}", f"{dst_project_id}.{dst_dataset_id}"
+        )
+        dst_view.description = src_view.description
+        self.client.delete_table(dst_view, not_found_ok=True)
+        self.client.create_table(dst_view)
+        self.table_metadata_cache.mark_exists(dst_view_id)
+        logger.debug(f"View {src_view_id} copied to {dst_view_id}")
+
+        if drop:
+            self.drop_table(src_view_id)
+            logger.debug(f"View {src_view_id} dropped")
+
+    def copy_routine(
+        self, src_routine_id: str, dst_routine_id: str, drop: bool = False
+    ):
+        bigquery = import_module_cached("google.cloud.bigquery")
+
+        src_project_id, src_dataset_id, _ = self.get_table_fqn_parts(src_routine_id)
+        dst_project_id, dst_dataset_id, _ = self.get_table_fqn_parts(dst_routine_id)
+
+        # Create or replace
+        src_routine = self.client.get_routine(src_routine_id)
+        dst_routine = bigquery.Routine(dst_routine_id)
+        dst_routine.body = src_routine.body.replace(
+            f"{src_project_id}.{src_dataset_id}", f"{dst_project_id}.{dst_dataset_id}"
+        )
+        dst_routine.type_ = src_routine.type_
+        dst_routine.description = src_routine.description
+        dst_routine.language = src_routine.language
+        dst_routine.arguments = src_routine.arguments
+        dst_routine.return_type = src_routine.return_type
+        dst_routine.imported_libraries = src_routine.imported_libraries
+        self.client.delete_routine(dst_routine, not_found_ok=True)
+        self.client.create_routine(dst_routine)
+        logger.debug(f"Routine {src_routine_id} copied to {dst_routine_id}")
+
+        if drop:
+            self.client.delete_routine(src_routine_id)
+            logger.debug(f"Routine {src_routine_id} dropped")
+
+    def copy_dataset(
+        self,
+        src_dataset_fqn: str,
+        dst_dataset_fqn: str,
+        *,
+        max_workers: int = 8,
+    ) -> dict[str, list[str]]:
+        """Clone every table, routine and view of a dataset, creating the destination dataset if needed
+
+        Tables are copied with copy jobs first, then routines and views together, as they may reference tables and each other.
+        Routines and views failing because of a missing dependency are retried once it exists.
+        Materialized views and external tables are skipped.
+
+        Args:
+            src_dataset_fqn (str): `<projectid>.<datasetid>`
+            dst_dataset_fqn (str): `<projectid>.<datasetid>`
+            max_workers (int, optional): Maximum number of objects copied at the same time. Defaults to 8.
+
+        Returns:
+            dict[str, list[str]]: Copied object IDs per kind: tables, routines, views
+        """
+
+        bigquery = import_module_cached("google.cloud.bigquery")
+
+        for dataset_fqn in (src_dataset_fqn, dst_dataset_fqn):
+            if len(dataset_fqn.split(".")) != 2:
+                raise ValueError(f"{dataset_fqn} is not a valid dataset FQN")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        src_dataset = self.client.get_dataset(src_dataset_fqn)
+        dst_dataset = bigquery.Dataset(dst_dataset_fqn)
+        dst_dataset.location = src_dataset.location
+        self.client.create_dataset(dst_dataset, exists_ok=True)
+
+        table_ids, view_ids = [], []
+        for table in self.client.list_tables(src_dataset_fqn):
+            if table.table_type == "TABLE":
+                table_ids.append(table.table_id)
+            elif table.table_type == "VIEW":
+                view_ids.append(table.table_id)
+            else:
+                logger.warning(
+                    f"Skip copying {table.table_type}: {table.full_table_id}"
+                )
+        routine_ids = [
+            routine.routine_id for routine in self.client.list_routines(src_dataset_fqn)
+        ]
+
+        def _get_copies(ids: list[str], copy_func: Callable[[str, str], None]):
+            return [
+                (
+                    copy_func,
+                    f"{src_dataset_fqn}.{object_id}",
+                    f"{dst_dataset_fqn}.{object_id}",
+                )
+                for object_id in ids
+            ]
+
+        # Tables have no dependencies. Routines and views may reference each other in either direction, copy them in one pool
+        self._copy_concurrently(
+            _get_copies(table_ids, self.copy_table),
+            max_workers=max_workers,
+            retry_failed=False,
+        )
+        logger.info(
+            f"[Copied] {len(table_ids)} tables, {src_dataset_fqn} --> {dst_dataset_fqn}"
+        )
+        self._copy_concurrently(
+            _get_copies(routine_ids, self.copy_routine)
+            + _get_copies(view_ids, self.copy_view),
+            max_workers=max_workers,
+            retry_failed=True,
+        )
+        logger.info(
+            f"[Copied] {len(routine_ids)} routines, {len(view_ids)} views, {src_dataset_fqn} --> {dst_dataset_fqn}"
+        )
+
+        return {"tables": table_ids, "routines": routine_ids, "views": view_ids}
 
     # MARK: Utilities
 
+    @staticmethod
+    def _copy_concurrently(
+        copies: list[tuple[Callable[[str, str], None], str, str]],
+        *,
+        max_workers: int,
+        retry_failed: bool,
+    ):
+        """Run `copy_func(src, dst)` for every `(copy_func, src, dst)`, optionally retrying failures in rounds while each round makes progress"""
+
+        pending = copies
+        while pending:
+            errors: dict[tuple[Callable[[str, str], None], str, str], Exception] = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(copy_func, src, dst): (copy_func, src, dst)
+                    for copy_func, src, dst in pending
+                }
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        errors[futures[future]] = e
+
+            # Retry only while some succeeded, otherwise the remaining errors are real
+            if errors and (not retry_failed or len(errors) == len(pending)):
+                for (_, src, _), error in errors.items():
+                    logger.error(f"Failed to copy {src}: {error}")
+                raise next(iter(errors.values()))
+            pending = list(errors.keys())
+
+    @staticmethod
+    def _normalize_query(query: str | list[str]) -> str:
+        # Reconstruct query, handle multiple queries in a single job
+        queries = query if isinstance(query, list) else [query]
+        queries = [textwrap.dedent(q).strip() for q in queries]
+        queries = [
+            q if q.endswith(";") else q + ";" for q in queries
+        ]  # Append ';' character for each query
+        return "\n".join(queries)
+
+    def _build_cache_key(self, query: str | list[str], parameters: dict) -> str:
+        # Unqualified table names resolve against the client's project and location
+        key = json.dumps(
+            [
+                self.client.project,
+                self.client.location,
+                self._normalize_query(query),
+                sorted((k, type(v).__name__, repr(v)) for k, v in parameters.items()),
+            ]
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    @staticmethod
+    def _build_query_parameters(parameters: dict) -> list:
+        bigquery = import_module_cached("google.cloud.bigquery")
+
+        # Evaluate parameter
+        query_parameters = []
+        for parameter, value in parameters.items():
+            # Already built, e.g. arrays of structs from insert_many
+            if isinstance(
+                value,
+                (
+                    bigquery.ScalarQueryParameter,
+                    bigquery.ArrayQueryParameter,
+                    bigquery.StructQueryParameter,
+                ),
+            ):
+                query_parameters.append(value)
+                continue
+
+            is_array = isinstance(value, list)
+            value_type_bq = BQ._get_bq_data_type(
+                parameter, value[0] if is_array else value
+            )
+            value_type_py = type(value[0]) if is_array else type(value)
+
+            # Handle data type conversions
+            if value_type_py == datetime.date:
+                value = (
+                    [v.strftime("%Y-%m-%d") for v in value]
+                    if is_array
+                    else value.strftime("%Y-%m-%d")
+                )
+
+            if is_array:
+                query_parameters.append(
+                    bigquery.ArrayQueryParameter(parameter, value_type_bq, value)
+                )
+            else:
+                query_parameters.append(
+                    bigquery.ScalarQueryParameter(parameter, value_type_bq, value)
+                )
+
+        return query_parameters
+
+    def _build_merge_load_query(
+        self,
+        dst_table_fqn: str,
+        load_options_str: str,
+        schema: list[dict] | None,
+        merge_keys: list[str],
+        merge_partition_column: str | None,
+    ) -> str:
+        """Build the script which loads into the `_staging` temp table and merges it into the destination"""
+
+        dst_schema = {
+            c["name"]: c["data_type"]
+            for c in self.get_table_metadata(dst_table_fqn)["schema"]
+        }
+        # Stage with the destination types unless told otherwise, so the MERGE needs no coercion
+        schema = schema or [
+            {"name": name, "data_type": data_type}
+            for name, data_type in dst_schema.items()
+        ]
+        columns = [column["name"] for column in schema]
+        required_columns = merge_keys + (
+            [merge_partition_column] if merge_partition_column else []
+        )
+        for column in required_columns:
+            if column not in columns:
+                raise ValueError(f"Column {column} is not loaded into {dst_table_fqn}")
+
+        # DECLARE must come first in a script
+        query_parts = []
+        on_conditions = [f"T.`{key}` = S.`{key}`" for key in merge_keys]
+        if merge_partition_column:
+            data_type = dst_schema[merge_partition_column]
+            query_parts.append(
+                f"DECLARE _partition_min {data_type};\nDECLARE _partition_max {data_type};"
+            )
+            on_conditions.append(
+                f"T.`{merge_partition_column}` BETWEEN _partition_min AND _partition_max"
+            )
+        schema_str = ",\n".join(
+            [f"  {column['name']} {column['data_type']}" for column in schema]
+        )
+        query_parts.append(
+            f"LOAD DATA INTO TEMP TABLE `_staging` (\n{schema_str}\n)\nFROM FILES (\n{load_options_str}\n);"
+        )
+        if merge_partition_column:
+            query_parts.append(
+                f"SET (_partition_min, _partition_max) = (SELECT AS STRUCT MIN(`{merge_partition_column}`), MAX(`{merge_partition_column}`) FROM `_staging`);"
+            )
+
+        update_columns = [column for column in columns if column not in merge_keys]
+        columns_str = ", ".join(f"`{column}`" for column in columns)
+        merge_parts = [
+            f"MERGE `{dst_table_fqn}` T",
+            "USING `_staging` S",
+            f"ON {' AND '.join(on_conditions)}",
+        ]
+        if update_columns:
+            update_str = ", ".join(
+                f"`{column}` = S.`{column}`" for column in update_columns
+            )
+            merge_parts.append(f"WHEN MATCHED THEN UPDATE SET {update_str}")
+        merge_parts.append(
+            f"WHEN NOT MATCHED THEN INSERT ({columns_str}) VALUES ({', '.join(f'S.`{column}`' for column in columns)});"
+        )
+        query_parts.append("\n".join(merge_parts))
+        return "\n".join(query_parts)
+
+    @staticmethod
+    def _get_bq_data_type(name: str, value) -> str:
+        value_type_py = type(value)
+        if value_type_py not in PY_DATA_TYPE__BQ_DATA_TYPE:
+            raise ValueError(
+                f"Unsupported type for parameter {name}: {value_type_py}. Supported types are: {list(PY_DATA_TYPE__BQ_DATA_TYPE.keys())}"
+            )
+
+        if value_type_py == datetime.datetime and value.tzinfo is not None:
+            return "TIMESTAMP"
+        return PY_DATA_TYPE__BQ_DATA_TYPE[value_type_py]
+
     @staticmethod
     def get_table_fqn_parts(name: str | list[str]) -> list[str] | list[list[str]]:
         """Get  fully qualified table name, following this format `<projectid>.<datasetid>.<tableid>`
@@ -740,18 +2560,312 @@ class BQ:
         if not BQ.get_table_fqn_parts(name):
             raise ValueError(f"{name} is not a valid table FQN")
 
-    def is_table_exists(self, table_fqn: str) -> bool:
+    def is_table_exists(self, table_fqn: str, use_cache: bool = False) -> bool:
+        """
+        Args:
+            table_fqn (str): Table FQN
+            use_cache (bool, optional): Trust the metadata cache when it knows the table exists. A table missing from the cache is always confirmed with the API, it may have been created after the cache was loaded. Defaults to False.
+        """
+
         not_found = import_attr_cached("google.cloud.exceptions", "NotFound")
 
         self.raise_for_invalid_table_fqn(table_fqn)
+
+        if use_cache:
+            hit, metadata = self.table_metadata_cache.get(table_fqn)
+            if hit and metadata is not None:
+                return True
+
         try:
             self.client.get_table(table_fqn)
-            return True
         except not_found:
             return False
+        self.table_metadata_cache.mark_exists(table_fqn)
+        return True
+
+    def _export_download(
+        self,
+        query: str,
+        dst_dirpath: str,
+        gcs_client: cloudstorage_types.GCS,
+        *,
+        parameters: dict = {},
+        format: DataFileFormat = DataFileFormat.CSV,
+        max_workers: int = 8,
+    ) -> list[str]:
+        """Export a query into temporary GCS shards and download them into a local directory, returns the local shard paths in shard order"""
+
+        match format:
+            case DataFileFormat.CSV:
+                file_pattern, compression = "*.csv.gz", DataFileCompression.GZIP
+            case DataFileFormat.PARQUET:
+                file_pattern, compression = "*.parquet", None
+            case _:
+                raise ValueError(f"Unsupported download format: {format}")
+
+        dst_gcs_prefix = gcs_client.build_tmp_dirpath()
+        try:
+            # Export to GCS
+            self.export_data(
+                query,
+                f"gs://{gcs_client.bucket.name}/{dst_gcs_prefix}/{file_pattern}",
+                parameters=parameters,
+                format=format,
+                compression=compression,
+            )
+
+            # Download from GCS, shards are sorted by name to keep the export order
+            tmp_blobs = sorted(
+                gcs_client.list_blobs(dst_gcs_prefix), key=lambda blob: blob.name
+            )
+            return gcs_client.download_many(
+                tmp_blobs, dst_dirpath, max_workers=max_workers, move=True
+            )
+        finally:
+            [
+                gcs_client.delete_blob(blob_filepath)
+                for blob_filepath in gcs_client.list_blobs(dst_gcs_prefix)
+            ]  # Remove temporary GCS files
+
+    @staticmethod
+    def _is_read_only_query(query: str | list[str]) -> bool:
+        if isinstance(query, list):
+            if len(query) != 1:
+                return False
+            query = query[0]
+
+        # Drop leading comments, then allow a single SELECT / WITH statement only
+        query = re.sub(r"^(\s+|--[^\n]*\n?|/\*.*?\*/)*", "", query, flags=re.DOTALL)
+        query = query.rstrip().rstrip(";")
+        return (
+            bool(re.match(r"(SELECT|WITH)\b", query, re.IGNORECASE))
+            and ";" not in query
+        )
+
+    def _query_and_wait(
+        self, query: str | list[str], parameters: dict
+    ) -> bigquery_types.table.RowIterator | None:
+        """Run a short read-only query through `query_and_wait`, returns None if the regular job path should be used instead"""
+
+        bigquery = import_module_cached("google.cloud.bigquery")
+        server_error = import_attr_cached("google.api_core.exceptions", "ServerError")
+
+        query = self._normalize_query(query)
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=self._build_query_parameters(parameters)
+        )
+        reserved = None
+        if self.cost_guard is not None:
+            reserved = self._apply_cost_guard(query, parameters, job_config)
+
+        logger.debug(f"🔎 Query:\n{query}")
+        t = time.time()
+        try:
+            rows = self.client.query_and_wait(query, job_config=job_config)
+        except server_error as e:
+            # Only a server side failure can succeed as a job, anything else would fail twice or, after a client timeout, bill twice
+            if reserved is not None:
+                self.cost_guard.settle(reserved, 0)
+            logger.warning(f"Short query path failed, falling back to a job: {e}")
+            return None
+        except BaseException:
+            if reserved is not None:
+                self.cost_guard.settle(reserved, 0)
+            raise
+
+        metrics = JobMetrics.from_rows(rows)
+        logger.debug(
+            f"[Served by] {metrics.served_by}, [Query ID] {rows.query_id}, [Job ID] {rows.job_id}, [Rows] {rows.total_rows}, [Elapsed] {_humanize_precisedelta()(datetime.timedelta(seconds=time.time() - t))}"
+        )
+        if reserved is not None:
+            # Billed bytes are not reported here, processed bytes are the on-demand billing basis
+            self.cost_guard.settle(reserved, metrics.total_bytes_processed)
+        self._emit_metrics([metrics])
+        return rows
+
+    def _apply_cost_guard(
+        self,
+        query: str,
+        parameters: dict,
+        query_job_config: bigquery_types.QueryJobConfig,
+    ) -> int:
+        """Enforce the budgets on the job config, returns the bytes reserved from the session budget"""
+
+        bigquery = import_module_cached("google.cloud.bigquery")
+
+        # Dry run once per normalized query & parameters
+        cache_key = self._build_cache_key(query, parameters)
+        estimate = self.cost_guard.get_estimate(cache_key)
+        if estimate is None:
+            dry_run_job = self.client.query(
+                query,
+                job_config=bigquery.QueryJobConfig(
+                    dry_run=True,
+                    use_query_cache=False,
+                    query_parameters=query_job_config.query_parameters,
+                ),
+            )
+            estimate = dry_run_job.total_bytes_processed or 0
+            self.cost_guard.set_estimate(cache_key, estimate)
+        logger.debug(f"Cost guard estimate: {_humanize_naturalsize()(estimate)}")
+
+        reserved = self.cost_guard.check(estimate)
+        maximum_bytes_billed = self.cost_guard.get_maximum_bytes_billed(reserved)
+        if maximum_bytes_billed is not None:
+            query_job_config.maximum_bytes_billed = maximum_bytes_billed
+        return reserved
+
+    def _emit_job_metrics(
+        self,
+        query_job: bigquery_types.QueryJob,
+        child_jobs: list[bigquery_types.QueryJob] = [],
+    ):
+        if not self.job_callbacks:
+            return
+
+        self._emit_metrics(
+            [JobMetrics.from_job(query_job)]
+            + [
+                JobMetrics.from_job(job, parent_job_id=query_job.job_id)
+                for job in child_jobs
+            ]
+        )
+
+    def _emit_metrics(self, records: list[JobMetrics]):
+        for callback in self.job_callbacks:
+            for record in records:
+                try:
+                    callback(record)
+                except Exception as e:
+                    logger.warning(f"Job callback {callback} failed: {e}")
+
+    def _get_read_client(self) -> bigquery_storage_types.BigQueryReadClient:
+        if self._read_client is None:
+            with self._read_client_lock:
+                if self._read_client is None:
+                    bigquery_storage = import_module_cached(
+                        "google.cloud.bigquery_storage"
+                    )
+                    if self.emulator_grpc_endpoint:
+                        grpc = import_module_cached("grpc")
+                        transport = import_attr_cached(
+                            "google.cloud.bigquery_storage_v1.services.big_query_read.transports",
+                            "BigQueryReadGrpcTransport",
+                        )(channel=grpc.insecure_channel(self.emulator_grpc_endpoint))
+                        self._read_client = bigquery_storage.BigQueryReadClient(
+                            transport=transport
+                        )
+                    else:
+                        self._read_client = bigquery_storage.BigQueryReadClient(
+                            credentials=self.client._credentials
+                        )
+        return self._read_client
+
+    def _create_query_read_session(
+        self, query: str, parameters: dict, max_stream_count: int
+    ) -> bigquery_storage_types.ReadSession:
+        bigquery_storage = import_module_cached("google.cloud.bigquery_storage")
+
+        if max_stream_count < 1:
+            raise ValueError("max_stream_count must be at least 1")
+
+        # Streams are read concurrently, a single stream keeps the row order
+        if max_stream_count > 1 and self._contains_order_by(query):
+            logger.debug("Query has ORDER BY, reading through a single stream")
+            max_stream_count = 1
+
+        # Query results land in an anonymous table, read it directly
+        query_job = self.execute_query(query, parameters=parameters)
+        table = query_job.destination
+        if table is None:
+            raise ValueError("Query has no result table to read from")
+
+        session = self._get_read_client().create_read_session(
+            parent=f"projects/{self.client.project}",
+            read_session=bigquery_storage.ReadSession(
+                table=f"projects/{table.project}/datasets/{table.dataset_id}/tables/{table.table_id}",
+                data_format=bigquery_storage.DataFormat.ARROW,
+            ),
+            max_stream_count=max_stream_count,
+        )
+        logger.debug(
+            f"Read session created: {session.name}, {len(session.streams)} stream(s)"
+        )
+        return session
+
+    @staticmethod
+    def _contains_order_by(query: str) -> bool:
+        """Conservative like google-cloud-bigquery, an ORDER BY anywhere outside comments and strings counts"""
+
+        query = re.sub(
+            r"--[^\n]*|#[^\n]*|/\*.*?\*/|'(?:\\.|[^'\\])*'|\"(?:\\.|[^\"\\])*\"",
+            " ",
+            query,
+            flags=re.DOTALL,
+        )
+        return bool(re.search(r"\bORDER\s+BY\b", query, re.IGNORECASE))
+
+    @staticmethod
+    def _read_session_schema(
+        session: bigquery_storage_types.ReadSession,
+    ) -> pyarrow_types.Schema:
+        pyarrow = import_module_cached("pyarrow")
+        return pyarrow.ipc.read_schema(
+            pyarrow.py_buffer(session.arrow_schema.serialized_schema)
+        )
+
+    def _read_session_batches(
+        self, session: bigquery_storage_types.ReadSession
+    ) -> Iterator[pyarrow_types.RecordBatch]:
+        if not session.streams:
+            return
+
+        read_client = self._get_read_client()
+        q = queue.Queue(maxsize=len(session.streams) * 4)  # Backpressure on readers
+        stop = Event()
+        stream_done = object()
+
+        def _put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _read_stream(stream_name: str):
+            try:
+                for page in read_client.read_rows(stream_name).rows(session).pages:
+                    if not _put(page.to_arrow()):
+                        return  # Consumer stopped
+            except Exception as e:
+                _put(e)
+            finally:
+                _put(stream_done)
+
+        with ThreadPoolExecutor(max_workers=len(session.streams)) as executor:
+            for stream in session.streams:
+                executor.submit(_read_stream, stream.name)
+
+            try:
+                remaining = len(session.streams)
+                while remaining:
+                    item = q.get()
+                    if item is stream_done:
+                        remaining -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                stop.set()  # Release readers blocked on a full queue
 
     def close(self):
         self.client.close()
+        if self._read_client is not None:
+            self._read_client.transport.close()
+            self._read_client = None
         logger.debug("BQ client close")
 
 
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from enum import StrEnum
+from typing import TYPE_CHECKING
+from typing import Callable
+
+from ._lazy_import import import_attr_cached
+from ._lazy_logger import logger
+from .dttm import Level
+from .dttm import generate_dates
+from .json import dump_file_atomic
+
+
+if TYPE_CHECKING:
+    from .bigquery import BQ
+
+
+class PeriodStatus(StrEnum):
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Backfill:
+    """Run a query once per day or month of a date range, several periods at a time
+
+    A string query gets the period bounds as `@period_start` and `@period_end` DATE parameters (both inclusive), a callable is called with `(period_start, period_end)` and returns the query to run.
+    Failed periods are retried with exponential backoff. Progress is kept in a JSON manifest, saved after every period, so running the same backfill again only runs the periods not done yet.
+    """
+
+    def __init__(
+        self,
+        bq: BQ,
+        query: str | Callable[[datetime.date, datetime.date], str | list[str]],
+        start_date: datetime.date | str,
+        end_date: datetime.date | str,
+        level: Level = Level.DAY,
+        *,
+        parameters: dict = {},
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 30,
+        manifest_filepath: str | None = None,
+    ):
+        """
+        Args:
+            bq (BQ): Client running the queries
+            query (str | Callable[[datetime.date, datetime.date], str | list[str]]): Templated query, or a function building the query of a period
+            start_date (datetime.date | str): First date of the range
+            end_date (datetime.date | str): Last date of the range, inclusive
+            level (Level, optional): Period size. Defaults to Level.DAY.
+            parameters (dict, optional): Extra query parameters, shared by every period. Defaults to {}.
+            max_concurrency (int, optional): Maximum number of periods running at once. Defaults to 4.
+            max_retries (int, optional): Retries of a failed period, bad requests and exceeded cost budgets are never retried. Defaults to 3.
+            retry_backoff_seconds (float, optional): Wait before the first retry, doubled on every retry. Defaults to 30.
+            manifest_filepath (str | None, optional): Progress manifest. Required for a callable query. Defaults to None (`.utill_backfill_<hash>.json` in the working directory, the hash covers the query, the parameters, the range and the level).
+        """
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+
+        self.bq = bq
+        self.query = query
+        self.level = level
+        self.parameters = parameters
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.periods = self.get_periods(start_date, end_date, level)
+
+        if manifest_filepath is None:
+            # Functions cannot be fingerprinted reliably, every lambda is named `<lambda>`
+            if not isinstance(query, str):
+                raise ValueError(
+                    "manifest_filepath is required when query is a callable"
+                )
+            key = json.dumps(
+                [
+                    query,
+                    parameters,
+                    str(self.periods[0][0]),
+                    str(self.periods[-1][1]),
+                    level.name,
+                ],
+                sort_keys=True,
+                default=str,
+            )
+            manifest_filepath = (
+                f".utill_backfill_{hashlib.sha256(key.encode()).hexdigest()[:12]}.json"
+            )
+        self.manifest_filepath = manifest_filepath
+
+    @staticmethod
+    def get_periods(
+        start_date: datetime.date | str, end_date: datetime.date | str, level: Level
+    ) -> list[tuple[datetime.date, datetime.date]]:
+        """Returns the (first day, last day) of every period, oldest first"""
+
+        periods = []
+        for period_start in generate_dates(start_date, end_date, level):
+            if level == Level.MONTH:
+                period_end = (period_start + datetime.timedelta(days=32)).replace(
+                    day=1
+                ) - datetime.timedelta(days=1)
+            else:
+                period_end = period_start
+            periods.append((period_start, period_end))
+        return periods
+
+    # MARK: Manifest
+
+    def load_manifest(self) -> dict[str, dict]:
+        if not os.path.exists(self.manifest_filepath):
+            return {}
+        with open(self.manifest_filepath) as f:
+            return json.load(f)
+
+    # MARK: Run
+
+    def _run_period(
+        self, period_start: datetime.date, period_end: datetime.date
+    ) -> tuple[str, int]:
+        """Run one period, retrying on failure. Returns (job ID, attempts)"""
+
+        from .bigquery import CostBudgetExceededError
+
+        bad_request = import_attr_cached("google.api_core.exceptions", "BadRequest")
+
+        if isinstance(self.query, str):
+            query = self.query
+            parameters = {
+                **self.parameters,
+                "period_start": period_start,
+                "period_end": period_end,
+            }
+        else:
+            query = self.query(period_start, period_end)
+            parameters = self.parameters
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return self.bq.execute_query(query, parameters).job_id, attempt
+            except bad_request:
+                raise  # The query itself is wrong, retrying will not help
+            except CostBudgetExceededError:
+                raise  # The budget stays exceeded, stop right away
+            except Exception as e:
+                if attempt > self.max_retries:
+                    raise
+                backoff = self.retry_backoff_seconds * 2 ** (attempt - 1)
+                logger.warning(
+                    f"[Period] {period_start}, [Attempt] {attempt} failed: {e}, retrying in {backoff:.0f}s"
+                )
+                time.sleep(backoff)
+
+    def run(self) -> dict[str, str]:
+        """Run every period not done yet
+
+        Returns:
+            dict[str, str]: `PeriodStatus` by period start date, including the periods done in earlier runs
+        """
+
+        manifest = self.load_manifest()
+        pending = [
+            (period_start, period_end)
+            for period_start, period_end in self.periods
+            if manifest.get(str(period_start), {}).get("status") != PeriodStatus.DONE
+        ]
+        logger.info(
+            f"[Periods] {len(self.periods)}, [Done] {len(self.periods) - len(pending)}, [Pending] {len(pending)}, [Manifest] {self.manifest_filepath}"
+        )
+
+        t = time.time()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = {
+                executor.submit(self._run_period, period_start, period_end): (
+                    period_start,
+                    period_end,
+                )
+                for period_start, period_end in pending
+            }
+            try:
+                for future in as_completed(futures):
+                    period_start, period_end = futures[future]
+                    try:
+                        job_id, attempts = future.result()
+                        entry = {
+                            "status": PeriodStatus.DONE,
+                            "job_id": job_id,
+                            "attempts": attempts,
+                        }
+                        logger.info(f"[Period] {period_start} - {period_end} done")
+                    except Exception as e:
+                        entry = {"status": PeriodStatus.FAILED, "error": str(e)}
+                        logger.error(
+                            f"[Period] {period_start} - {period_end} failed: {e}"
+                        )
+                    manifest[str(period_start)] = entry
+                    dump_file_atomic(manifest, self.manifest_filepath)
+            except:
+                executor.shutdown(
+                    cancel_futures=True
+                )  # Stop queued periods, the manifest keeps what finished
+                raise
+
+        statuses = {
+            str(period_start): PeriodStatus(manifest[str(period_start)]["status"])
+            for period_start, _ in self.periods
+        }
+        n_failed = list(statuses.values()).count(PeriodStatus.FAILED)
+        logger.info(
+            f"[Periods] {len(statuses)}, [Done] {len(statuses) - n_failed}, [Failed] {n_failed}, [Elapsed] {time.time() - t:.2f}s"
+        )
+        return statuses
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from dataclasses import field
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from ._lazy_import import import_attr_cached
+from ._lazy_logger import logger
+from .json import dump_file_atomic
+
+
+if TYPE_CHECKING:
+    from .bigquery import BQ
+
+
+STATE_FILENAME = ".utill_dag_state.json"
+
+_REF = r"(`[^`]+`(?:\.`[^`]+`)*|[A-Za-z_][\w-]*(?:\.[A-Za-z_][\w-]*)+)"
+_TARGET_PATTERN = re.compile(
+    r"\b(?:CREATE\s+(?:OR\s+REPLACE\s+)?(?:TABLE|VIEW|MATERIALIZED\s+VIEW)(?:\s+IF\s+NOT\s+EXISTS)?|INSERT(?:\s+INTO)?|MERGE(?:\s+INTO)?)\s+"
+    + _REF,
+    re.IGNORECASE,
+)
+_SOURCE_PATTERN = re.compile(r"\b(?:FROM|JOIN|USING)\s+" + _REF, re.IGNORECASE)
+# EXTRACT(part FROM expr) is not a table reference
+_EXTRACT_PATTERN = re.compile(
+    r"\bEXTRACT\s*\(\s*\w+(?:\s*\(\s*\w+\s*\))?\s+FROM\b", re.IGNORECASE
+)
+# Table aliases and CTE names, a `alias.column` reference after them is not a table
+_ALIAS_PATTERN = re.compile(
+    r"\b(?:(?:FROM|JOIN)\s+(?:`[^`]+`|[\w.-]+)\s+(?:AS\s+)?([A-Za-z_]\w*)|([A-Za-z_]\w*)\s+AS\s*\()",
+    re.IGNORECASE,
+)
+_NOISE_PATTERN = re.compile(
+    r"--[^\n]*|#[^\n]*|/\*.*?\*/|'(?:\\.|[^'\\])*'|\"(?:\\.|[^\"\\])*\"", re.DOTALL
+)
+
+
+class NodeStatus(StrEnum):
+    RAN = "ran"
+    SKIPPED = "skipped"  # Inputs unchanged since the last successful run
+    FAILED = "failed"
+    BLOCKED = "blocked"  # An upstream node failed
+
+
+@dataclass
+class SqlNode:
+    name: str  # Path relative to the directory
+    sql: str
+    targets: set[str]
+    sources: set[str]
+    upstreams: set[str] = field(default_factory=set)
+
+
+def _normalize_ref(ref: str, default_project: str) -> str:
+    parts = [part for part in ref.replace("`", "").split(".") if part]
+    return ".".join([default_project, *parts] if len(parts) == 2 else parts)
+
+
+def parse_sql(name: str, sql: str, default_project: str) -> SqlNode:
+    """Find the tables a script writes (CREATE / INSERT / MERGE targets) and reads (FROM / JOIN / USING sources)
+
+    Only qualified names (`dataset.table` or `project.dataset.table`) are considered, so CTEs and aliases are ignored. A `name.field` whose first part is an alias or CTE name in the file, e.g. `FROM t.items` over an array column, is skipped.
+    """
+
+    # Comments and string literals may contain anything that looks like a reference
+    code = _NOISE_PATTERN.sub(" ", sql)
+    code = _EXTRACT_PATTERN.sub(lambda m: m.group(0)[:-4], code)
+
+    aliases = {
+        alias.lower()
+        for match in _ALIAS_PATTERN.findall(code)
+        for alias in match
+        if alias
+    }
+    targets = {
+        _normalize_ref(m, default_project) for m in _TARGET_PATTERN.findall(code)
+    }
+    sources = {
+        _normalize_ref(m, default_project)
+        for m in _SOURCE_PATTERN.findall(code)
+        if "`" in m or m.count(".") > 1 or m.split(".")[0].lower() not in aliases
+    }
+    return SqlNode(name=name, sql=sql, targets=targets, sources=sources - targets)
+
+
+def build_dag(dirpath: str, default_project: str) -> dict[str, SqlNode]:
+    """Parse every `.sql` file under a directory and link each node to the nodes producing the tables it reads
+
+    Nodes writing the same table run in file name order.
+
+    Returns:
+        dict[str, SqlNode]: Nodes by name, in file name order
+    """
+
+    nodes: dict[str, SqlNode] = {}
+    for root, _, filenames in os.walk(dirpath):
+        for filename in filenames:
+            if filename.endswith(".sql"):
+                filepath = os.path.join(root, filename)
+                name = os.path.relpath(filepath, dirpath)
+                with open(filepath) as f:
+                    nodes[name] = parse_sql(name, f.read(), default_project)
+    nodes = dict(sorted(nodes.items()))
+
+    producers: dict[str, list[str]] = {}
+    for node in nodes.values():
+        for target in node.targets:
+            # Chain writers of the same table, the latest writer stands for the table
+            if target in producers:
+                node.upstreams.add(producers[target][-1])
+            producers.setdefault(target, []).append(node.name)
+    for node in nodes.values():
+        for source in node.sources:
+            node.upstreams.update(
+                producer
+                for producer in producers.get(source, [])
+                if producer != node.name
+            )
+
+    get_topological_order(nodes)  # Fail early on cycles
+    return nodes
+
+
+def get_topological_order(nodes: dict[str, SqlNode]) -> list[str]:
+    order: list[str] = []
+    visiting: set[str] = set()
+    visited: set[str] = set()
+
+    def _visit(name: str, path: list[str]):
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+        visiting.add(name)
+        for upstream in sorted(nodes[name].upstreams):
+            _visit(upstream, path + [name])
+        visiting.remove(name)
+        visited.add(name)
+        order.append(name)
+
+    for name in nodes:
+        _visit(name, [])
+    return order
+
+
+class DagRunner:
+    """Run a directory of BigQuery `.sql` files in dependency order, independent files concurrently
+
+    With `incremental`, a file is skipped when its SQL, its upstream files and the last modified time of the external tables it reads are all unchanged since its last successful run, and its targets still exist.
+    Fingerprints are kept in a JSON state file, saved after every successful node so an interrupted run resumes.
+    """
+
+    def __init__(
+        self,
+        bq: BQ,
+        dirpath: str,
+        *,
+        max_concurrency: int = 4,
+        incremental: bool = True,
+        state_filepath: str | None = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.bq = bq
+        self.dirpath = dirpath
+        self.max_concurrency = max_concurrency
+        self.incremental = incremental
+        self.state_filepath = state_filepath or os.path.join(dirpath, STATE_FILENAME)
+        self.nodes = build_dag(dirpath, bq.client.project)
+        self.order = get_topological_order(self.nodes)
+
+    # MARK: State
+
+    def _load_state(self) -> dict[str, str]:
+        if not self.incremental or not os.path.exists(self.state_filepath):
+            return {}
+        with open(self.state_filepath) as f:
+            return json.load(f)
+
+    def get_fingerprints(self) -> dict[str, str]:
+        google_api_error = import_attr_cached(
+            "google.api_core.exceptions", "GoogleAPIError"
+        )
+
+        produced = {target for node in self.nodes.values() for target in node.targets}
+        fingerprints: dict[str, str] = {}
+        for name in self.order:
+            node = self.nodes[name]
+            external = {}
+            for source in sorted(node.sources - produced):
+                try:
+                    metadata = self.bq.get_table_metadata(source)
+                except ValueError:
+                    continue  # Not a table reference, e.g. a qualified column
+                except google_api_error as e:
+                    # E.g. INFORMATION_SCHEMA views or a dataset the caller cannot read, count it as changed
+                    logger.warning(f"Cannot fingerprint {source}, {name} will run: {e}")
+                    external[source] = f"unknown {time.time()}"
+                    continue
+                last_modified_time = (metadata or {}).get("last_modified_time")
+                external[source] = (
+                    last_modified_time.isoformat() if last_modified_time else None
+                )
+            key = json.dumps(
+                [
+                    node.sql,
+                    sorted(fingerprints[upstream] for upstream in node.upstreams),
+                    external,
+                ]
+            )
+            fingerprints[name] = hashlib.sha256(key.encode()).hexdigest()
+        return fingerprints
+
+    # MARK: Run
+
+    def run(self, full_refresh: bool = False, dry_run: bool = False) -> dict[str, str]:
+        """Run the DAG
+
+        Args:
+            full_refresh (bool, optional): Run every node without fingerprinting or touching the saved state, so the next incremental run runs every node once more. Defaults to False.
+            dry_run (bool, optional): Only log what would run. Defaults to False.
+
+        Returns:
+            dict[str, str]: `NodeStatus` by node name
+        """
+
+        state = {} if full_refresh else self._load_state()
+        fingerprints = (
+            self.get_fingerprints() if self.incremental and not full_refresh else {}
+        )
+
+        # A node whose upstream re-ran reads new data even if its own fingerprint matches
+        def _is_unchanged(name: str) -> bool:
+            return (
+                name in fingerprints
+                and all(
+                    statuses[u] == NodeStatus.SKIPPED
+                    for u in self.nodes[name].upstreams
+                )
+                and state.get(name) == fingerprints[name]
+                and all(
+                    self.bq.is_table_exists(t, use_cache=True)
+                    for t in self.nodes[name].targets
+                )
+            )
+
+        statuses: dict[str, str] = {}
+        if dry_run:
+            for name in self.order:
+                statuses[name] = (
+                    NodeStatus.SKIPPED if _is_unchanged(name) else NodeStatus.RAN
+                )
+                logger.info(f"[{statuses[name].capitalize()}] {name}")
+            return statuses
+
+        def _run_node(name: str) -> float:
+            t = time.time()
+            self.bq.execute_query(self.nodes[name].sql)
+            for target in self.nodes[name].targets:
+                self.bq.table_metadata_cache.mark_exists(target)
+            return time.time() - t
+
+        t = time.time()
+        pending = list(self.order)
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while pending or running:
+                # Resolve every node whose upstreams are settled
+                for name in list(pending):
+                    upstream_statuses = [
+                        statuses.get(u) for u in self.nodes[name].upstreams
+                    ]
+                    if any(
+                        s in (NodeStatus.FAILED, NodeStatus.BLOCKED)
+                        for s in upstream_statuses
+                    ):
+                        statuses[name] = NodeStatus.BLOCKED
+                        pending.remove(name)
+                        logger.warning(f"[Blocked] {name}")
+                    elif all(
+                        s in (NodeStatus.RAN, NodeStatus.SKIPPED)
+                        for s in upstream_statuses
+                    ):
+                        pending.remove(name)
+                        if _is_unchanged(name):
+                            statuses[name] = NodeStatus.SKIPPED
+                            logger.info(f"[Skipped] {name}")
+                        else:
+                            running[executor.submit(_run_node, name)] = name
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        elapsed = future.result()
+                    except Exception as e:
+                        statuses[name] = NodeStatus.FAILED
+                        logger.error(f"[Failed] {name}: {e}")
+                        continue
+                    statuses[name] = NodeStatus.RAN
+                    logger.info(f"[Ran] {name}, [Elapsed] {elapsed:.2f}s")
+                    if name in fingerprints:
+                        state[name] = fingerprints[name]
+                        dump_file_atomic(state, self.state_filepath)
+
+        counts = {s: list(statuses.values()).count(s) for s in set(statuses.values())}
+        logger.info(
+            f"[Nodes] {len(statuses)}, {', '.join(f'[{s.capitalize()}] {n}' for s, n in sorted(counts.items()))}, [Elapsed] {time.time() - t:.2f}s"
+        )
+        return statuses
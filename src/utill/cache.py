@@ -0,0 +1,162 @@
+import os
+import pickle
+import time
+from collections import OrderedDict
+from enum import Enum
+from enum import auto
+from threading import Lock
+from typing import Any
+
+from ._lazy_logger import logger
+
+
+class CacheStorage(Enum):
+    MEMORY = auto()
+    DISK = auto()
+
+
+class ResultCache:
+    """TTL + LRU cache for query results, kept in memory or pickled on disk
+
+    Lookup statistics are available through `get_stats()`.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        max_entries: int = 128,
+        storage: CacheStorage = CacheStorage.MEMORY,
+        dirpath: str | None = None,
+    ):
+        """
+        Args:
+            ttl_seconds (float, optional): Entry lifetime. Defaults to 3600.
+            max_entries (int, optional): Maximum number of entries, the least recently used entry is evicted first. Defaults to 128.
+            storage (CacheStorage, optional): Where to keep the values. Defaults to CacheStorage.MEMORY.
+            dirpath (str | None, optional): Directory for CacheStorage.DISK. Defaults to `~/.utill/cache`.
+        """
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.storage = storage
+
+        # key -> (expires_at, bytes_saved_per_hit, value), value is None for disk storage
+        self._entries: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+        self._lock = Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes_saved": 0}
+
+        if storage == CacheStorage.DISK:
+            from .settings import ENV_DIR
+
+            self.dirpath = os.path.expanduser(dirpath or os.path.join(ENV_DIR, "cache"))
+            os.makedirs(self.dirpath, exist_ok=True)
+            self._load_disk_index()
+
+    def get(self, key: str) -> Any | None:
+        """Get a cached value, returns None on miss or expiry"""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    self._delete(key)
+                self._stats["misses"] += 1
+                return None
+
+            expires_at, bytes_saved_per_hit, value = entry
+            if self.storage == CacheStorage.DISK:
+                try:
+                    with open(self._get_filepath(key), "rb") as f:
+                        pickle.load(f)  # Skip metadata
+                        value = pickle.load(f)
+                    os.utime(self._get_filepath(key))  # Keep LRU order across runs
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    self._delete(key)
+                    self._stats["misses"] += 1
+                    return None
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            self._stats["bytes_saved"] += bytes_saved_per_hit
+            return value
+
+    def set(self, key: str, value: Any, bytes_saved_per_hit: int = 0):
+        """Store a value
+
+        Args:
+            key (str): Cache key
+            value (Any): Value, must be picklable for disk storage
+            bytes_saved_per_hit (int, optional): Bytes a hit avoids processing, used for statistics. Defaults to 0.
+        """
+
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            if self.storage == CacheStorage.DISK:
+                # Metadata first, so the index can be loaded without reading values
+                with open(self._get_filepath(key), "wb") as f:
+                    pickle.dump((expires_at, bytes_saved_per_hit), f)
+                    pickle.dump(value, f)
+                self._entries[key] = (expires_at, bytes_saved_per_hit, None)
+            else:
+                self._entries[key] = (expires_at, bytes_saved_per_hit, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._delete(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def invalidate(self, key: str | None = None):
+        """Remove one entry, or everything if key is not given"""
+
+        with self._lock:
+            for k in [key] if key is not None else list(self._entries):
+                if k in self._entries:
+                    self._delete(k)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "hit_ratio": self._stats["hits"] / lookups if lookups else 0.0,
+            }
+
+    # MARK: Utilities
+
+    def _get_filepath(self, key: str) -> str:
+        return os.path.join(self.dirpath, f"{key}.pkl")
+
+    def _delete(self, key: str):
+        self._entries.pop(key, None)
+        if self.storage == CacheStorage.DISK:
+            try:
+                os.remove(self._get_filepath(key))
+            except FileNotFoundError:
+                pass
+
+    def _load_disk_index(self):
+        filepaths = [
+            os.path.join(self.dirpath, filename)
+            for filename in os.listdir(self.dirpath)
+            if filename.endswith(".pkl")
+        ]
+        for filepath in sorted(filepaths, key=os.path.getmtime):
+            key = os.path.basename(filepath).removesuffix(".pkl")
+            try:
+                with open(filepath, "rb") as f:
+                    expires_at, bytes_saved_per_hit = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                os.remove(filepath)
+                continue
+            if expires_at < time.time():
+                os.remove(filepath)
+                continue
+            self._entries[key] = (expires_at, bytes_saved_per_hit, None)
+
+        while len(self._entries) > self.max_entries:
+            self._delete(next(iter(self._entries)))
+        logger.debug(f"Result cache loaded: {len(self._entries)} entries")
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import atexit
+import sys
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from ._lazy_import import import_attr_cached
+from ._lazy_import import import_module_cached
+from ._lazy_logger import logger
+
+
+if TYPE_CHECKING:
+    import requests
+    from google.auth.credentials import Credentials
+
+    from .bigquery import BQ
+    from .cloudstorage import GCS
+
+
+_lock = Lock()
+_bq_clients: dict[tuple[str | None, str | None], BQ] = {}
+_gcs_clients: dict[tuple[str | None, str | None], GCS] = {}
+
+
+def build_http_session(credentials: Credentials, pool_maxsize: int) -> requests.Session:
+    """Build an authorized HTTP session whose connection pool holds `pool_maxsize` connections per host
+
+    The default pool keeps 10 connections, more concurrent requests than that open and discard extra connections.
+    """
+
+    if pool_maxsize < 1:
+        raise ValueError("pool_maxsize must be at least 1")
+
+    http_adapter = import_attr_cached("requests.adapters", "HTTPAdapter")(
+        pool_connections=pool_maxsize, pool_maxsize=pool_maxsize
+    )
+    session = import_attr_cached("google.auth.transport.requests", "AuthorizedSession")(
+        credentials
+    )
+    session.mount("https://", http_adapter)
+    session.mount("http://", http_adapter)
+    return session
+
+
+def get_default_credentials(scopes: tuple[str, ...]) -> Credentials:
+    credentials, _ = import_module_cached("google.auth").default(scopes=scopes)
+    return credentials
+
+
+def get_bq(
+    project_id: str | None = None,
+    location: str | None = None,
+    *,
+    http_pool_maxsize: int | None = None,
+) -> BQ:
+    """Get the shared BQ client of a project and location, creating it on first use
+
+    Args:
+        project_id (str | None, optional): Billing project. Defaults to GCP_PROJECT_ID env.
+        location (str | None, optional): Job location. Defaults to GCP_REGION env.
+        http_pool_maxsize (int | None, optional): HTTP connection pool size, only used when the client is created. Defaults to None (library default).
+
+    Returns:
+        BQ: The shared client
+    """
+
+    from .bigquery import BQ
+    from .settings import envs
+
+    key = (project_id or envs.GCP_PROJECT_ID, location or envs.GCP_REGION)
+    with _lock:
+        if key not in _bq_clients:
+            _bq_clients[key] = BQ(
+                location=key[1], project_id=key[0], http_pool_maxsize=http_pool_maxsize
+            )
+        return _bq_clients[key]
+
+
+def get_gcs(
+    bucket: str | None = None,
+    project_id: str | None = None,
+    *,
+    http_pool_maxsize: int | None = None,
+) -> GCS:
+    """Get the shared GCS client of a bucket and project, creating it on first use
+
+    Args:
+        bucket (str | None, optional): Bucket name. Defaults to GCS_BUCKET env.
+        project_id (str | None, optional): Project. Defaults to GCP_PROJECT_ID env.
+        http_pool_maxsize (int | None, optional): HTTP connection pool size, only used when the client is created. Defaults to None (library default).
+
+    Returns:
+        GCS: The shared client
+    """
+
+    from .cloudstorage import GCS
+    from .settings import envs
+
+    key = (project_id or envs.GCP_PROJECT_ID, bucket or envs.GCS_BUCKET)
+    with _lock:
+        if key not in _gcs_clients:
+            _gcs_clients[key] = GCS(
+                bucket=key[1], project_id=key[0], http_pool_maxsize=http_pool_maxsize
+            )
+        return _gcs_clients[key]
+
+
+def close_all():
+    """Close every client in the registry and the module-level `bq` and `gcs` singletons, registered to run at exit"""
+
+    with _lock:
+        clients = [*_bq_clients.values(), *_gcs_clients.values()]
+        _bq_clients.clear()
+        _gcs_clients.clear()
+
+    # Only the modules already imported can have open singletons
+    singletons = [
+        getattr(sys.modules[module_name], attr_name)
+        for module_name, attr_name in (
+            (f"{__package__}.bigquery", "bq"),
+            (f"{__package__}.cloudstorage", "gcs"),
+        )
+        if module_name in sys.modules
+    ]
+
+    for client in [*clients, *singletons]:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close {type(client).__name__} client: {e}")
+
+
+atexit.register(close_all)
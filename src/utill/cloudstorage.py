@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from threading import Lock
 from typing import TYPE_CHECKING
 from typing import cast
@@ -13,8 +16,24 @@ if TYPE_CHECKING:
     from google.cloud import storage as storage_types
 
 
+COMPOSE_MAX_COMPONENTS = 32  # GCS limit of source objects per compose request
+
+
 class GCS:
-    def __init__(self, bucket: str | None = None, project_id: str | None = None):
+    def __init__(
+        self,
+        bucket: str | None = None,
+        project_id: str | None = None,
+        *,
+        http_pool_maxsize: int | None = None,
+    ):
+        """
+        Args:
+            bucket (str | None, optional): Bucket name. Defaults to GCS_BUCKET env.
+            project_id (str | None, optional): Project. Defaults to GCP_PROJECT_ID env.
+            http_pool_maxsize (int | None, optional): HTTP connection pool size, raise it above the number of concurrent transfers. Defaults to None (library default of 10).
+        """
+
         from .settings import envs
 
         storage = import_module_cached("google.cloud.storage")
@@ -27,7 +46,20 @@ class GCS:
                 "Bucket name must be provided either as an argument or set in environment variables."
             )
 
-        self.client = storage.Client(project=project_id or envs.GCP_PROJECT_ID)
+        client_kwargs = {}
+        if http_pool_maxsize is not None:
+            from . import clients
+
+            client_kwargs["credentials"] = clients.get_default_credentials(
+                storage.Client.SCOPE
+            )
+            client_kwargs["_http"] = clients.build_http_session(
+                client_kwargs["credentials"], http_pool_maxsize
+            )
+
+        self.client = storage.Client(
+            project=project_id or envs.GCP_PROJECT_ID, **client_kwargs
+        )
         self.bucket = self.client.bucket(bucket or envs.GCS_BUCKET)
         logger.debug(
             f"GCS client open, project: {self.client.project}, bucket: {self.bucket.name}"
@@ -68,9 +100,42 @@ class GCS:
                 f"Copied gs://{src_bucket}/{src_blobpath} to gs://{dst_bucket}/{dst_blobpath}"
             )
 
-    def upload(self, src_filepath: str, dst_blobpath: str, move: bool = False):
+    def upload(
+        self,
+        src_filepath: str,
+        dst_blobpath: str,
+        move: bool = False,
+        *,
+        composite_threshold_bytes: int | None = None,
+        max_workers: int = 8,
+    ):
+        """Upload a local file, optionally as a parallel composite upload from `composite_threshold_bytes`
+
+        A composite upload slices the file into `max_workers` ranges, uploads them concurrently as temporary objects next to the destination, then composes them into the destination.
+        Composite objects carry a CRC32C checksum but no MD5 hash. The temporary objects cannot be deleted in buckets with a retention policy or hold, and incur early deletion charges in Nearline / Coldline / Archive buckets.
+
+        Args:
+            src_filepath (str): Local file
+            dst_blobpath (str): Destination blob path
+            move (bool, optional): Delete the local file after uploading. Defaults to False.
+            composite_threshold_bytes (int | None, optional): Minimum size for a composite upload, e.g. `ByteSize.MB * 150`. Defaults to None (always a single stream).
+            max_workers (int, optional): Number of slices uploaded concurrently. Defaults to 8.
+        """
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
         blob = self.get_blob(dst_blobpath)
-        blob.upload_from_filename(src_filepath)
+        size = os.path.getsize(src_filepath)
+        if (
+            composite_threshold_bytes is not None
+            and size > 0
+            and size >= composite_threshold_bytes
+            and max_workers > 1
+        ):
+            self._upload_composite(src_filepath, blob, size, max_workers)
+        else:
+            blob.upload_from_filename(src_filepath)
 
         # Move mode
         if move:
@@ -82,6 +147,98 @@ class GCS:
                 f"Uploaded {src_filepath} to gs://{self.bucket.name}/{blob.name}"
             )
 
+    def _upload_composite(
+        self,
+        src_filepath: str,
+        blob: storage_types.Blob,
+        size: int,
+        max_workers: int,
+    ):
+        import mimetypes
+
+        from .string import generate_random_string
+
+        humanize = import_module_cached("humanize")
+
+        slice_size = -(-size // max_workers)
+        ranges = [
+            (start, min(slice_size, size - start))
+            for start in range(0, size, slice_size)
+        ]
+        component_prefix = (
+            f"{blob.name}_components_{generate_random_string(alphanum=True)}"
+        )
+        components: list[
+            storage_types.Blob
+        ] = []  # Every temporary object, for clean up
+
+        def _upload_slice(component: storage_types.Blob, start: int, length: int):
+            with open(src_filepath, "rb") as f:
+                f.seek(start)
+                component.upload_from_file(f, size=length)
+
+        t = time.time()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = []
+                for i, (start, length) in enumerate(ranges):
+                    component = self.get_blob(f"{component_prefix}/{i:05d}")
+                    components.append(component)
+                    futures.append(
+                        executor.submit(_upload_slice, component, start, length)
+                    )
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except:
+                    executor.shutdown(cancel_futures=True)  # Stop queued slices
+                    raise
+
+            # A compose takes at most 32 sources, compose in levels until the rest fits in one
+            sources = list(components)
+            level = 0
+            while len(sources) > COMPOSE_MAX_COMPONENTS:
+                level += 1
+                composed = []
+                for i in range(0, len(sources), COMPOSE_MAX_COMPONENTS):
+                    intermediate = self.get_blob(
+                        f"{component_prefix}/level{level}_{i // COMPOSE_MAX_COMPONENTS:05d}"
+                    )
+                    components.append(intermediate)
+                    intermediate.compose(sources[i : i + COMPOSE_MAX_COMPONENTS])
+                    composed.append(intermediate)
+                sources = composed
+
+            blob.content_type = (
+                mimetypes.guess_type(src_filepath)[0] or "application/octet-stream"
+            )
+            blob.compose(sources)
+        finally:
+            # Best effort, a component left behind must not hide the original error
+            try:
+                self.bucket.delete_blobs(components, on_error=lambda _: None)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to delete components gs://{self.bucket.name}/{component_prefix}/: {e}"
+                )
+        elapsed = time.time() - t
+
+        logger.info(
+            f"[Composite] {len(ranges)} slice(s), [Size] {humanize.naturalsize(size)}, [Throughput] {humanize.naturalsize(size / elapsed if elapsed else 0)}/s, [Elapsed] {elapsed:.2f}s"
+        )
+
+    def upload_bytes(
+        self,
+        data: bytes,
+        dst_blobpath: str,
+        content_type: str = "application/octet-stream",
+    ):
+        blob = self.get_blob(dst_blobpath)
+        blob.upload_from_string(data, content_type=content_type)
+        logger.debug(
+            f"Uploaded {len(data)} bytes to gs://{self.bucket.name}/{blob.name}"
+        )
+
     def download(
         self,
         src_blobpath: str | storage_types.Blob,
@@ -103,6 +260,74 @@ class GCS:
                 f"Copied gs://{self.bucket.name}/{blob.name} to {dst_filepath}"
             )
 
+    def download_many(
+        self,
+        src_blobpaths: list[str | storage_types.Blob],
+        dst_dirpath: str,
+        *,
+        max_workers: int = 8,
+        move: bool = False,
+    ) -> list[str]:
+        """Download multiple blobs concurrently into a local directory
+
+        Args:
+            src_blobpaths (list[str | storage_types.Blob]): Blobs to download
+            dst_dirpath (str): Local destination directory
+            max_workers (int, optional): Maximum number of concurrent downloads. Defaults to 8.
+            move (bool, optional): Delete each blob after it is downloaded. Defaults to False.
+
+        Returns:
+            list[str]: Local file paths, in the same order as `src_blobpaths`
+        """
+
+        humanize = import_module_cached("humanize")
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        blobs = [
+            self.get_blob(blobpath) if isinstance(blobpath, str) else blobpath
+            for blobpath in src_blobpaths
+        ]
+        dst_filepaths = [
+            os.path.join(dst_dirpath, blob.name.split("/")[-1]) for blob in blobs
+        ]
+
+        def _download(blob: storage_types.Blob, dst_filepath: str) -> float:
+            t = time.time()
+            self.download(blob, dst_filepath, move=move)
+            return time.time() - t
+
+        # Download concurrently, results are collected by index so the shard order is preserved
+        t = time.time()
+        elapsed_per_blob: list[float] = [0.0] * len(blobs)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_download, blob, dst_filepath): i
+                for i, (blob, dst_filepath) in enumerate(zip(blobs, dst_filepaths))
+            }
+            try:
+                for future in as_completed(futures):
+                    elapsed_per_blob[futures[future]] = future.result()
+            except:
+                executor.shutdown(cancel_futures=True)  # Stop queued downloads
+                raise
+        elapsed = time.time() - t
+
+        # Report per-blob timing once every download is done
+        total_size = 0
+        for dst_filepath, blob_elapsed in zip(dst_filepaths, elapsed_per_blob):
+            size = os.path.getsize(dst_filepath)
+            total_size += size
+            logger.debug(
+                f"[Shard] {os.path.basename(dst_filepath)}, [Size] {humanize.naturalsize(size)}, [Elapsed] {blob_elapsed:.2f}s"
+            )
+        logger.info(
+            f"[Downloaded] {len(blobs)} blob(s), [Size] {humanize.naturalsize(total_size)}, [Throughput] {humanize.naturalsize(total_size / elapsed if elapsed else 0)}/s, [Slowest] {max(elapsed_per_blob, default=0):.2f}s, [Elapsed] {elapsed:.2f}s"
+        )
+
+        return dst_filepaths
+
     # MARK: Utilities
 
     @staticmethod
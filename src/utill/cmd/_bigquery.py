@@ -6,20 +6,47 @@ def _upload_csv(
     cluster_cols: list[str] = None,
     project: str = None,
 ):
-    from ..my_bq import BQ
+    from ..bigquery import BQ
 
-    bq = BQ(project)
+    bq = BQ(project_id=project)
     bq.upload_csv(
         src_filename,
         dst_table_fqn,
         [{"name": col, "data_type": dtype} for col, dtype in columns],
-        partition_col,
-        cluster_cols,
+        partition_by=partition_col,
+        clustering_fields=list(cluster_cols) if cluster_cols else None,
     )
 
 
 def _download_table(src_table_fqn: str, dst_filename: str, project: str):
-    from ..my_bq import BQ
+    from ..bigquery import BQ
 
-    bq = BQ(project)
+    bq = BQ(project_id=project)
     bq.download_csv(f"SELECT * FROM {src_table_fqn}", dst_filename)
+
+
+def _run_dir(
+    dirpath: str,
+    concurrency: int,
+    full_refresh: bool,
+    state_file: str,
+    dry_run: bool,
+    project: str,
+):
+    import sys
+
+    from ..bigquery import BQ
+    from ..bigquery_dag import DagRunner
+    from ..bigquery_dag import NodeStatus
+
+    bq = BQ(project_id=project)
+    runner = DagRunner(
+        bq,
+        dirpath,
+        max_concurrency=concurrency,
+        state_filepath=state_file,
+    )
+    statuses = runner.run(full_refresh=full_refresh, dry_run=dry_run)
+
+    if any(s in (NodeStatus.FAILED, NodeStatus.BLOCKED) for s in statuses.values()):
+        sys.exit(1)
@@ -115,6 +115,30 @@ def main__bq__download_table(**kwargs):
     _download_table(**kwargs)
 
 
+@main__bq.command("run-dir", help="Run a directory of SQL files in dependency order")
+@click.argument("dirpath", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "-c", "concurrency", type=int, default=4, help="Maximum concurrent queries"
+)
+@click.option(
+    "--full-refresh",
+    is_flag=True,
+    help="Run every file without fingerprinting or updating the state file",
+)
+@click.option(
+    "--state-file",
+    "state_file",
+    type=click.Path(dir_okay=False),
+    help="State file, defaults to DIRPATH/.utill_dag_state.json",
+)
+@click.option("--dry-run", is_flag=True, help="Only print what would run")
+@click.option("--project", type=str, help="Billing project")
+def main__bq__run_dir(**kwargs):
+    from ._bigquery import _run_dir
+
+    _run_dir(**kwargs)
+
+
 # MARK: Encyrption
 
 
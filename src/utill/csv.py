@@ -1,7 +1,9 @@
 import csv
 import gzip
 import os
+import shutil
 import sys
+from typing import Iterator
 
 from ._lazy_logger import logger
 from .constants import ByteSize
@@ -30,39 +32,38 @@ def compress(
     header=None,
     file_count=1,
 ):
-    src_filename = os.path.expanduser(src_filename)
-    current_size = 0
-    dst_filename = f"{src_filename}_part{str(file_count).rjust(6, '0')}.gz"
-    os.remove(dst_filename) if os.path.exists(dst_filename) else None
-    logger.debug(f"📄 Compress csv {src_filename} --> {dst_filename}")
-    gz = gzip.open(dst_filename, "wt")
-
-    src_fopen = src_fopen or open(src_filename)
-    header = header or src_fopen.readline()
+    """Gzip a csv into parts of at most `max_size_bytes` uncompressed bytes each, every part has the header
 
-    gz.write(header)
-
-    while True:
-        line = src_fopen.readline()
-        if not line:
-            break
+    Parts are yielded as soon as they are closed, so the caller can process them while the next one is being compressed.
+    Records are never split, a quoted field spanning multiple lines stays within one part.
+    """
 
-        gz.write(line)
-        current_size += len(line.encode("utf-8"))
+    src_filename = os.path.expanduser(src_filename)
+    src_fopen = src_fopen or open(src_filename, "rb")
+    header = header or _read_record(src_fopen)
 
-        if current_size >= max_size_bytes:
-            gz.close()
+    try:
+        record = _read_record(src_fopen)
+        while True:
+            current_size = 0
+            dst_filename = f"{src_filename}_part{str(file_count).rjust(6, '0')}.gz"
+            os.remove(dst_filename) if os.path.exists(dst_filename) else None
+            logger.debug(f"📄 Compress csv {src_filename} --> {dst_filename}")
+            with gzip.open(dst_filename, "wb", compresslevel=6) as gz:
+                gz.write(header)
+                while record and current_size < max_size_bytes:
+                    gz.write(record)
+                    current_size += len(record)
+                    record = _read_record(src_fopen)
             yield dst_filename
 
+            if not record:
+                break
             file_count += 1
-            yield from compress(
-                src_filename, keep, max_size_bytes, src_fopen, header, file_count
-            )
-            return
+    finally:
+        src_fopen.close()
 
-    gz.close()
     os.remove(src_filename) if not keep else None
-    yield dst_filename
 
 
 def combine(
@@ -108,3 +109,169 @@ def combine(
             if delete:
                 os.remove(src_filename)
                 logger.debug(f"Delete {src_filename}")
+
+
+def _open_binary(filename: str, mode: str):
+    if filename.endswith(".gz"):
+        return gzip.open(filename, mode, compresslevel=6)
+    return open(filename, mode)
+
+
+def _read_record(f) -> bytes:
+    """Read one CSV record from a binary file, a quoted field may span multiple lines"""
+
+    record = b""
+    in_quotes = False
+    for line in f:
+        record += line
+        # An escaped quote ("") flips the state twice, so only the parity matters
+        if line.count(b'"') % 2:
+            in_quotes = not in_quotes
+        if not in_quotes:
+            break
+    return record
+
+
+def _split_extension(filename: str) -> tuple[str, str]:
+    if filename.endswith(".csv.gz"):
+        return filename.removesuffix(".csv.gz"), ".csv.gz"
+    elif filename.endswith(".csv"):
+        return filename.removesuffix(".csv"), ".csv"
+    raise ValueError("Output filename must ends with '.csv' or '.csv.gz'!")
+
+
+def stream_combine(
+    src_filenames: list[str],
+    dst_filename: str,
+    delete: bool = False,
+    row_limit: int | None = None,
+) -> str | list[str]:
+    """Combine CSV files sharing the same header by streaming their bytes, without parsing the rows
+
+    Only the header of each non-first file is dropped. Source files ending with `.gz` are decompressed on the fly, and the output is gzipped if `dst_filename` ends with `.csv.gz`.
+
+    Args:
+        src_filenames (list[str]): Source CSV files, plain or gzipped
+        dst_filename (str): Output file, ends with `.csv` or `.csv.gz`
+        delete (bool, optional): Delete each source file once combined. Defaults to False.
+        row_limit (int | None, optional): Split the output into parts of at most this many rows, named `<name>_000001.csv`, `<name>_000002.csv`, ... Defaults to None.
+
+    Returns:
+        str | list[str]: The output file name, or the part file names if `row_limit` is set
+    """
+
+    _split_extension(dst_filename)  # Validate extension
+
+    if row_limit:
+        return list(
+            stream_combine_parts(src_filenames, dst_filename, row_limit, delete)
+        )
+
+    dst_filename = os.path.expanduser(dst_filename)
+    header = b""
+    with _open_binary(dst_filename, "wb") as fout:
+        for src_filename in src_filenames:
+            src_filename = os.path.expanduser(src_filename)
+
+            with _open_binary(src_filename, "rb") as fin:
+                # Write header only at first file
+                src_header = _read_record(fin)
+                if not header:
+                    header = src_header
+                    fout.write(header)
+                elif src_header and src_header != header:
+                    raise ValueError(f"Header mismatch in {src_filename}")
+                last_byte = src_header[-1:]
+
+                # Write body
+                while chunk := fin.read(shutil.COPY_BUFSIZE):
+                    fout.write(chunk)
+                    last_byte = chunk[-1:]
+
+            # Make sure the next file starts on a new line
+            if last_byte and last_byte != b"\n":
+                fout.write(b"\n")
+
+            logger.debug(f"Combine {src_filename}")
+
+            if delete:
+                os.remove(src_filename)
+                logger.debug(f"Delete {src_filename}")
+
+    return dst_filename
+
+
+def stream_combine_parts(
+    src_filenames: list[str],
+    dst_filename: str,
+    row_limit: int,
+    delete: bool = False,
+) -> Iterator[str]:
+    """Same as `stream_combine` with `row_limit`, but yields each part file name as soon as the part is complete
+
+    Records are counted while streaming, a quoted field spanning multiple lines counts as one record. Every part gets its own header.
+    """
+
+    if row_limit < 1:
+        raise ValueError("row_limit must be at least 1")
+
+    dst_basename, dst_fileextension = _split_extension(os.path.expanduser(dst_filename))
+    header = b""
+    part = 0
+    fout = None
+    row_count = 0
+    try:
+        for src_filename in src_filenames:
+            src_filename = os.path.expanduser(src_filename)
+
+            with _open_binary(src_filename, "rb") as fin:
+                src_header = _read_record(fin)
+                if not header:
+                    header = src_header
+                elif src_header and src_header != header:
+                    raise ValueError(f"Header mismatch in {src_filename}")
+
+                in_quotes = False
+                for line in fin:
+                    # Open the next part lazily, so there is no trailing empty part
+                    if fout is None:
+                        part += 1
+                        fout = _open_binary(
+                            f"{dst_basename}_{part:06}{dst_fileextension}", "wb"
+                        )
+                        fout.write(header)
+
+                    if not line.endswith(b"\n"):
+                        line += b"\n"  # Last line of a file without trailing newline
+                    fout.write(line)
+
+                    if line.count(b'"') % 2:
+                        in_quotes = not in_quotes
+                    if in_quotes:
+                        continue  # Record continues on the next line
+
+                    row_count += 1
+                    if row_count >= row_limit:
+                        fout.close()
+                        fout = None
+                        row_count = 0
+                        yield f"{dst_basename}_{part:06}{dst_fileextension}"
+
+            logger.debug(f"Combine {src_filename}")
+
+            if delete:
+                os.remove(src_filename)
+                logger.debug(f"Delete {src_filename}")
+
+        # Last part, or a header-only part if there is no row at all
+        if fout is None and part == 0:
+            part += 1
+            fout = _open_binary(f"{dst_basename}_{part:06}{dst_fileextension}", "wb")
+            fout.write(header)
+        if fout is not None:
+            fout.close()
+            fout = None
+            yield f"{dst_basename}_{part:06}{dst_fileextension}"
+    finally:
+        if fout is not None:
+            fout.close()
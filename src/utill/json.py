@@ -1,4 +1,5 @@
 import json
+import os
 import re
 
 
@@ -60,3 +61,14 @@ def load_jsonc_file(path) -> dict:
         pattern = r'("(?:\\.|[^"\\])*")|\/\/.*|\/\*[\s\S]*?\*\/'
         content = re.sub(pattern, lambda m: m.group(1) if m.group(1) else "", content)
         return json.loads(content)
+
+
+def dump_file_atomic(data, path: str):
+    """
+    Write data as JSON through a temporary file, so readers never see a half written file
+    """
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
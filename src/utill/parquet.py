@@ -0,0 +1,52 @@
+import os
+
+from ._lazy_import import import_module_cached
+from ._lazy_logger import logger
+
+
+def combine(
+    src_filenames: list[str],
+    dst_filename: str,
+    delete: bool = False,
+) -> str:
+    """Combine Parquet files sharing the same schema by copying their row groups, without going through CSV
+
+    Args:
+        src_filenames (list[str]): Source Parquet files
+        dst_filename (str): Output file, ends with `.parquet`
+        delete (bool, optional): Delete each source file once combined. Defaults to False.
+
+    Returns:
+        str: The output file name
+    """
+
+    pq = import_module_cached("pyarrow.parquet")
+
+    if not dst_filename.endswith(".parquet"):
+        raise ValueError("Output filename must ends with '.parquet'!")
+    if not src_filenames:
+        raise ValueError("No source file to combine!")
+
+    dst_filename = os.path.expanduser(dst_filename)
+    writer = None
+    try:
+        for src_filename in src_filenames:
+            src_filename = os.path.expanduser(src_filename)
+
+            src_file = pq.ParquetFile(src_filename)
+            if writer is None:
+                writer = pq.ParquetWriter(dst_filename, src_file.schema_arrow)
+            for i in range(src_file.num_row_groups):
+                writer.write_table(src_file.read_row_group(i))
+            src_file.close()
+
+            logger.debug(f"Combine {src_filename}")
+
+            if delete:
+                os.remove(src_filename)
+                logger.debug(f"Delete {src_filename}")
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return dst_filename
@@ -1,26 +1,29 @@
 import multiprocessing
+from functools import lru_cache
 
 from ._lazy_import import import_module_cached
 from ._lazy_logger import logger
 
 
-def xlsx_to_csv(filename: str, sheet: str):
+@lru_cache(maxsize=1)
+def _get_spatial_connection():
+    # Installing & loading the spatial extension is slow, do it once per process
     duckdb = import_module_cached("duckdb")
     con = duckdb.connect()
-    return (
-        con.execute("install spatial;")
-        .execute("load spatial;")
-        .execute(f"select * from st_read('{filename}', layer='{sheet}');")
-        .fetchall()
-    )
+    con.execute("install spatial;").execute("load spatial;")
+    return con
 
 
-def csv_to_xlsx(filename: str, output_file_path: str):
+def xlsx_to_csv(filename: str, sheet: str):
+    con = _get_spatial_connection().cursor()
+    return con.execute(
+        f"select * from st_read('{filename}', layer='{sheet}');"
+    ).fetchall()
+
+
+def csv_to_xlsx(filename: str, output_file_path: str, threads: int | None = None):
     logger.info(f"Converting csv '{filename}' into xlsx '{output_file_path}' ...")
-    duckdb = import_module_cached("duckdb")
-    con = duckdb.connect()
-    con.execute("install spatial;").execute("load spatial;").execute(
-        f"set threads to {multiprocessing.cpu_count()};"
-    ).execute(
+    con = _get_spatial_connection().cursor()
+    con.execute(f"set threads to {threads or multiprocessing.cpu_count()};").execute(
         f"copy '{filename}' to '{output_file_path}' with(format gdal, driver 'xlsx')"
     )